@@ -0,0 +1,154 @@
+"""
+Tests for the cross-platform relay CLI
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from zerobuffer import Reader, BufferConfig
+from zerobuffer.cross_platform import relay
+from zerobuffer.cross_platform.relay import connect_writer, make_transform
+from zerobuffer.cross_platform.writer import fill_frame_data
+
+XOR_KEY = 0x5A
+
+
+def reference_transform(transform: str, data: bytes) -> bytes:
+    """Straightforward per-byte version of each relay transform"""
+    if transform == "none":
+        return data
+    if transform == "reverse":
+        return data[::-1]
+    return bytes(b ^ XOR_KEY for b in data)
+
+
+def frame_data(size: int, frame_index: int) -> bytes:
+    """Frame contents as written by the writer CLI with the sequential pattern"""
+    data = bytearray(size)
+    fill_frame_data(data, frame_index, "sequential")
+    return bytes(data)
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure-python"])
+def numpy_available(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Iterator[bool]:
+    """Run a test with and without the numpy code paths"""
+    if request.param and not relay.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    monkeypatch.setattr(relay, "NUMPY_AVAILABLE", request.param)
+    yield request.param
+
+
+class TestMakeTransform:
+    """Test the relay transform functions"""
+
+    @pytest.mark.parametrize("transform", ["none", "reverse", "xor"])
+    @pytest.mark.parametrize("size", [1, 7, 1024, 128 * 1024 + 3])
+    def test_matches_reference(self, numpy_available: bool, transform: str, size: int) -> None:
+        """Test each transform against a per-byte reference"""
+        data = frame_data(size, 3)
+        # Frames hand the transform a memoryview over shared memory
+        result = make_transform(transform, XOR_KEY)(memoryview(bytearray(data)))
+        assert bytes(result) == reference_transform(transform, data)
+
+    def test_unknown_transform(self) -> None:
+        """Test that an unknown transform name is rejected"""
+        with pytest.raises(ValueError):
+            make_transform("rot13", XOR_KEY)
+
+    def test_xor_reuses_scratch_buffer(self, numpy_available: bool) -> None:
+        """Test the aliasing contract: an XOR result is only valid until the next call"""
+        xor = make_transform("xor", XOR_KEY)
+        first_data = frame_data(1024, 1)
+        second_data = frame_data(1024, 2)
+
+        first = xor(first_data)
+        assert bytes(first) == reference_transform("xor", first_data)
+        second = xor(second_data)
+        assert bytes(second) == reference_transform("xor", second_data)
+
+        if numpy_available:
+            # Both results view the same reused buffer - the first now shows the second frame
+            assert bytes(first) == reference_transform("xor", second_data)
+        else:
+            assert bytes(first) == reference_transform("xor", first_data)
+
+    def test_xor_scratch_grows(self, numpy_available: bool) -> None:
+        """Test that frames larger than any seen before are transformed in full"""
+        xor = make_transform("xor", XOR_KEY)
+        for size in (16, 4096, 8, 100000):
+            data = frame_data(size, size)
+            assert bytes(xor(data)) == reference_transform("xor", data)
+
+
+@pytest.mark.integration
+class TestRelayRoundTrip:
+    """Test writer -> relay CLI -> reader"""
+
+    @pytest.fixture
+    def buffer_name(self) -> Callable[[str], str]:
+        """Generate unique buffer names"""
+        suffix = f"{os.getpid()}_{time.time()}"
+        return lambda role: f"test_relay_{role}_{suffix}"
+
+    @pytest.mark.parametrize(
+        "transform,pipeline_depth,size",
+        [("none", 0, 1024), ("reverse", 1, 128 * 1024), ("xor", 4, 1024), ("xor", 0, 128 * 1024)],
+    )
+    def test_round_trip(
+        self, buffer_name: Callable[[str], str], transform: str, pipeline_depth: int, size: int
+    ) -> None:
+        """Test that every frame and the metadata arrive transformed and in order"""
+        frame_count = 20
+        input_name = buffer_name("in")
+        output_name = buffer_name("out")
+
+        with Reader(output_name, BufferConfig(metadata_size=1024, payload_size=4 * 1024 * 1024)) as reader:
+            process = subprocess.Popen(
+                [
+                    sys.executable, "-m", "zerobuffer.cross_platform", "relay", input_name, output_name,
+                    "-n", str(frame_count), "--buffer-size", str(4 * 1024 * 1024),
+                    "--transform", transform, "--xor-key", str(XOR_KEY),
+                    "--pipeline-depth", str(pipeline_depth), "--json-output",
+                ],
+                cwd=Path(__file__).parent.parent,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            try:
+                # The relay creates its input buffer - connect_writer waits for it
+                with connect_writer(input_name, verbose=False) as writer:
+                    writer.set_metadata(b"relay-metadata")
+                    for i in range(frame_count):
+                        writer.write_frame(frame_data(size, i))
+
+                    for i in range(frame_count):
+                        frame = reader.read_frame(timeout=10.0)
+                        assert frame is not None, f"Frame {i} was not relayed"
+                        with frame:
+                            assert bytes(frame.data) == reference_transform(transform, frame_data(size, i)), \
+                                f"Frame {i} does not match"
+
+                metadata = reader.get_metadata()
+                assert metadata is not None
+                assert bytes(metadata) == b"relay-metadata"
+                metadata.release()
+
+                stdout, stderr = process.communicate(timeout=30)
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+
+        assert process.returncode == 0, stderr.decode()
+        result = json.loads(stdout)
+        assert result["frames_relayed"] == frame_count
+        assert result["total_bytes"] == frame_count * size
+        assert result["metadata_relayed"] is True
+        assert result["errors"] == []
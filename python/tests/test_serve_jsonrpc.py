@@ -0,0 +1,185 @@
+"""
+Tests for the ZeroBufferServe JSON-RPC transport over stdin/stdout
+"""
+
+import json
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+import pytest
+
+
+def frame(message: Dict[str, Any]) -> bytes:
+    """Encode a message with its Content-Length header"""
+    body = json.dumps(message).encode()
+    return b"Content-Length: %d\r\n\r\n" % len(body) + body
+
+
+class ServeProcess:
+    """A zerobuffer_serve process driven through its request and response streams"""
+
+    def __init__(
+        self,
+        process: "subprocess.Popen[bytes]",
+        requests: IO[bytes],
+        responses: IO[bytes],
+        connection: Optional[socket.socket] = None,
+    ) -> None:
+        self.process = process
+        self._requests = requests
+        self._responses = responses
+        self._connection = connection
+
+    def send_raw(self, data: bytes) -> None:
+        """Write bytes to the server and flush them"""
+        self._requests.write(data)
+        self._requests.flush()
+
+    def send(self, method: str, params: Any = None, request_id: Optional[int] = None) -> None:
+        """Send a request, or a notification when request_id is None"""
+        message: Dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        if request_id is not None:
+            message["id"] = request_id
+        self.send_raw(frame(message))
+
+    def receive(self) -> Dict[str, Any]:
+        """Read one response, checking its framing"""
+        header = self._responses.readline()
+        assert header.startswith(b"Content-Length: ") and header.endswith(b"\r\n"), f"Bad header: {header!r}"
+        assert self._responses.readline() == b"\r\n", "Headers must end with an empty line"
+        length = int(header[len(b"Content-Length: "):])
+        body = self._responses.read(length)
+        assert len(body) == length, "Response body shorter than its Content-Length"
+        response: Dict[str, Any] = json.loads(body)
+        assert response["jsonrpc"] == "2.0"
+        return response
+
+    def call(self, method: str, params: Any, request_id: int) -> Dict[str, Any]:
+        """Send a request and return the response to it"""
+        self.send(method, params, request_id)
+        response = self.receive()
+        assert response["id"] == request_id
+        return response
+
+    def close(self) -> None:
+        """Close the client side of the streams"""
+        self._requests.close()
+        self._responses.close()
+        if self._connection is not None:
+            self._connection.close()
+
+    def close_requests(self) -> None:
+        """Signal end of stream to the server"""
+        self._requests.close()
+        if self._connection is not None:
+            # The socket stays open for the responses - only its sending side is shut down
+            self._connection.shutdown(socket.SHUT_WR)
+
+
+def start_serve(transport: str) -> ServeProcess:
+    """Start python -m zerobuffer_serve over pipes or over one socket used for both stdin and stdout"""
+    cwd = Path(__file__).parent.parent
+    command = [sys.executable, "-m", "zerobuffer_serve"]
+    if transport == "pipe":
+        # Pipes are read by the event loop
+        process = subprocess.Popen(
+            command, cwd=cwd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        assert process.stdin is not None and process.stdout is not None
+        return ServeProcess(process, process.stdin, process.stdout)
+
+    # One socket shared by stdin and stdout is read on the reader thread instead
+    ours, theirs = socket.socketpair()
+    process = subprocess.Popen(
+        command, cwd=cwd, stdin=theirs.fileno(), stdout=theirs.fileno(), stderr=subprocess.DEVNULL
+    )
+    theirs.close()
+    return ServeProcess(process, ours.makefile("wb"), ours.makefile("rb"), ours)
+
+
+@pytest.fixture(params=["pipe", "socket"])
+def serve(request: pytest.FixtureRequest) -> Iterator[ServeProcess]:
+    """A running serve process, killed if a test leaves it behind"""
+    serve_process = start_serve(request.param)
+    yield serve_process
+    if serve_process.process.poll() is None:
+        serve_process.process.kill()
+    serve_process.process.wait()
+    serve_process.close()
+
+
+class TestJsonRpcTransport:
+    """Test request framing, dispatch and response framing of the serve process"""
+
+    def test_session(self, serve: ServeProcess) -> None:
+        """Test a full session: requests, a notification, step execution, errors and shutdown"""
+        assert serve.call("health", {}, 1)["result"] is True
+
+        # Notifications get no response - the next response belongs to the next request
+        serve.send("health", {})
+        steps = serve.call("discover", None, 2)["result"]["steps"]
+        assert steps, "No steps discovered"
+        assert {"type", "pattern"} <= set(steps[0])
+
+        initialize = [{"Role": "reader", "Platform": "python", "Scenario": "s", "HostPid": 1, "FeatureId": 2}]
+        assert serve.call("initialize", initialize, 3)["result"] is True
+
+        # PascalCase fields in a list, as C# clients send them
+        result = serve.call(
+            "executeStep", [{"StepType": 0, "Step": "the test environment is initialized", "Process": "reader"}], 4
+        )["result"]
+        assert result["success"] is True, result["error"]
+        assert isinstance(result["logs"], list)
+
+        # camelCase fields in a dict
+        result = serve.call(
+            "executeStep", {"stepType": "Given", "step": "the test environment is initialized", "process": "reader"}, 5
+        )["result"]
+        assert result["success"] is True, result["error"]
+
+        result = serve.call("executeStep", {"stepType": "Given", "step": "no such step", "process": "reader"}, 6)
+        assert result["result"]["success"] is False
+        assert result["result"]["error"]
+
+        error = serve.call("bogus", {}, 7)["error"]
+        assert error["code"] == -32603
+
+        assert serve.call("shutdown", {}, 8)["result"] is None
+        serve.close_requests()
+        assert serve.process.wait(timeout=10) == 0
+
+    def test_message_split_across_reads(self, serve: ServeProcess) -> None:
+        """Test that a message arriving in pieces, cut inside the header and the body, is reassembled"""
+        data = frame({"jsonrpc": "2.0", "id": 1, "method": "health", "params": {}})
+        cuts = [0, 7, len(b"Content-Length: 4"), data.index(b"\r\n\r\n") + 2, len(data) - 5, len(data)]
+        for start, end in zip(cuts, cuts[1:]):
+            serve.send_raw(data[start:end])
+            # Give the server time to read each piece on its own
+            time.sleep(0.05)
+
+        assert serve.receive() == {"jsonrpc": "2.0", "id": 1, "result": True}
+
+    def test_burst_answered_in_order(self, serve: ServeProcess) -> None:
+        """Test that many requests written at once are all answered, in order"""
+        count = 100
+        burst: List[bytes] = []
+        for request_id in range(count):
+            burst.append(frame({"jsonrpc": "2.0", "id": request_id, "method": "health", "params": {}}))
+            if request_id % 10 == 0:
+                # Notifications mixed into the burst must not produce responses
+                burst.append(frame({"jsonrpc": "2.0", "method": "health", "params": {}}))
+        serve.send_raw(b"".join(burst))
+
+        assert [serve.receive()["id"] for _ in range(count)] == list(range(count))
+
+    def test_end_of_stream_stops_server(self, serve: ServeProcess) -> None:
+        """Test that the server exits when its input closes without a shutdown request"""
+        assert serve.call("health", {}, 1)["result"] is True
+        serve.close_requests()
+        assert serve.process.wait(timeout=10) == 0
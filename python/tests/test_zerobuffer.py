@@ -59,6 +59,38 @@ class TestTypes:
         assert oieb_view2.writer_pid == 1234
         assert oieb_view2.reader_pid == 5678
 
+    def test_oieb_view_used_bytes(self) -> None:
+        """Test OIEBView used_bytes with and without wrap-around"""
+        from zerobuffer.oieb_view import OIEBView
+
+        oieb_view = OIEBView(memoryview(bytearray(128)))
+        oieb_view.payload_size = 1000
+
+        oieb_view.payload_write_pos = 300
+        oieb_view.payload_read_pos = 100
+        assert oieb_view.used_bytes == 200
+
+        # Writer wrapped around behind the reader
+        oieb_view.payload_write_pos = 100
+        oieb_view.payload_read_pos = 300
+        assert oieb_view.used_bytes == 800
+
+        oieb_view.payload_write_pos = 300
+        assert oieb_view.used_bytes == 0
+
+    def test_oieb_view_dispose_idempotent(self) -> None:
+        """Test OIEBView can be disposed more than once"""
+        from zerobuffer.oieb_view import OIEBView
+
+        buffer = bytearray(128)
+        oieb_view = OIEBView(memoryview(buffer))
+
+        oieb_view.dispose()
+        oieb_view.dispose()
+
+        with pytest.raises(ValueError):
+            _ = oieb_view.payload_size
+
     def test_frame_header_pack_unpack(self) -> None:
         """Test FrameHeader serialization"""
         header = FrameHeader(payload_size=1024, sequence_number=42)
@@ -213,6 +245,68 @@ class TestFrameOperations:
                 assert writer.frames_written == frames_to_write
                 assert reader.frames_read == frames_to_write
 
+    def test_read_frames_batch(self, buffer_name: str) -> None:
+        """Test reading several signaled frames in one call"""
+        config = BufferConfig(metadata_size=1024, payload_size=64 * 1024)
+
+        with Reader(buffer_name, config) as reader:
+            with Writer(buffer_name) as writer:
+                for i in range(5):
+                    writer.write_frame(f"Frame {i}".encode())
+
+                # Batch is capped by max_frames
+                frames = reader.read_frames(3, timeout=1.0)
+                assert [frame.sequence for frame in frames] == [1, 2, 3]
+                for frame in frames:
+                    with frame:
+                        assert bytes(frame.data) == f"Frame {frame.sequence - 1}".encode()
+
+                # Batch stops at the frames already written
+                frames = reader.read_frames(10, timeout=1.0)
+                assert [frame.sequence for frame in frames] == [4, 5]
+                for frame in frames:
+                    frame.dispose()
+
+                # Nothing left - times out with an empty batch
+                assert reader.read_frames(10, timeout=0.1) == []
+                assert reader.frames_read == 5
+
+                # Released frames free the whole buffer again
+                assert reader._oieb is not None
+                assert reader._oieb.payload_free_bytes == reader._oieb.payload_size
+
+    def test_write_frames_batch(self, buffer_name: str) -> None:
+        """Test writing several frames in one call, including a batch larger than the buffer"""
+        config = BufferConfig(metadata_size=1024, payload_size=4096)
+
+        with Reader(buffer_name, config) as reader:
+            with Writer(buffer_name) as writer:
+                assert writer.write_frames(f"Frame {i}".encode() for i in range(5)) == 5
+
+                frames = reader.read_frames(10, timeout=1.0)
+                assert [frame.sequence for frame in frames] == [1, 2, 3, 4, 5]
+                for frame in frames:
+                    with frame:
+                        assert bytes(frame.data) == f"Frame {frame.sequence - 1}".encode()
+
+                # 20 frames of 1 KB do not fit in 4 KB - the batch must hand frames over while it waits
+                sequences: list[int] = []
+
+                def read_frames() -> None:
+                    while len(sequences) < 20:
+                        frame = reader.read_frame(timeout=5.0)
+                        assert frame is not None
+                        with frame:
+                            sequences.append(frame.sequence)
+
+                reader_thread = threading.Thread(target=read_frames)
+                reader_thread.start()
+                assert writer.write_frames([bytes(1024)] * 20) == 20
+                reader_thread.join(timeout=10.0)
+
+                assert sequences == list(range(6, 26))
+                assert writer.frames_written == 25
+
     def test_zero_copy_write(self, buffer_name: str) -> None:
         """Test zero-copy writing with memoryview"""
         config = BufferConfig(metadata_size=1024, payload_size=64 * 1024)
@@ -26,8 +26,9 @@ elif command == "reader":
 
     sys.exit(main())
 elif command == "relay":
-    print("Error: relay command not yet implemented", file=sys.stderr)
-    sys.exit(1)
+    from .relay import main
+
+    sys.exit(main())
 else:
     print(f"Unknown command: {command}")
     print("Valid commands: writer, reader, relay")
@@ -10,31 +10,52 @@ import json
 import sys
 import time
 import hashlib
+import random
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
 
 from zerobuffer import Reader
 
+try:
+    from blake3 import blake3
 
-def verify_frame_data(data: bytes, frame_index: int, pattern: str) -> bool:
-    """Verify frame data matches expected pattern."""
-    if pattern == "sequential":
-        for i in range(len(data)):
-            expected = (frame_index + i) % 256
-            if data[i] != expected:
-                return False
-        return True
-    elif pattern == "random":
-        import random
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    # blake3 is optional - only needed for --hash blake3
+    BLAKE3_AVAILABLE = False
 
-        random.seed(frame_index)
-        for i in range(len(data)):
-            expected = random.randint(0, 255)
-            if data[i] != expected:
-                return False
-        return True
+# Progress reporting: check the clock every 1024 frames, print at most once per second
+_REPORT_CHECK_MASK = 1023
+_REPORT_INTERVAL_NS = 1_000_000_000
+
+# Maximum number of per-frame checksums kept in the result
+_MAX_STORED_CHECKSUMS = 100
+
+
+@lru_cache(maxsize=8)
+def _pattern_block(pattern: str, size: int) -> bytes:
+    """Expected bytes for fixed patterns; the sequential block is long enough to slice at any frame offset."""
+    if pattern == "sequential":
+        return bytes(range(256)) * (size // 256 + 2)
     elif pattern == "zero":
-        return all(b == 0 for b in data)
+        return bytes(size)
     elif pattern == "ones":
-        return all(b == 0xFF for b in data)
+        return b"\xff" * size
+    else:
+        raise ValueError(f"No fixed block for pattern: {pattern}")
+
+
+def verify_frame_data(data: Union[bytes, memoryview], frame_index: int, pattern: str) -> bool:
+    """Verify frame data matches expected pattern (accepts a frame memoryview without copying)."""
+    if pattern == "sequential":
+        start = frame_index % 256
+        return data == memoryview(_pattern_block(pattern, len(data)))[start : start + len(data)]
+    elif pattern == "random":
+        # Regenerate the writer's seeded bytes in one draw
+        random.seed(frame_index)
+        return data == random.getrandbits(len(data) * 8).to_bytes(len(data), "little")
+    elif pattern in ("zero", "ones"):
+        return data == _pattern_block(pattern, len(data))
     elif pattern == "none":
         return True  # No verification
     else:
@@ -63,12 +84,21 @@ def main() -> int:
         help="Verify data pattern (default: none)",
     )
     parser.add_argument("--checksum", action="store_true", help="Calculate checksums for each frame")
+    parser.add_argument(
+        "--hash",
+        choices=["md5", "sha256", "blake3"],
+        default="md5",
+        help="Checksum algorithm (default: md5; blake3 requires: pip install blake3)",
+    )
     parser.add_argument("--batch-size", type=int, default=1, help="Read frames in batches (default: 1)")
     parser.add_argument("--json-output", action="store_true", help="Output results in JSON format")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
 
     args = parser.parse_args()
 
+    if args.hash == "blake3" and not BLAKE3_AVAILABLE:
+        parser.error("--hash blake3 requires the blake3 package. Install with: pip install blake3")
+
     result = {
         "operation": "read",
         "buffer_name": args.buffer_name,
@@ -96,50 +126,74 @@ def main() -> int:
                 print(f"Read metadata: {len(metadata)} bytes")
 
         # Read frames
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
+        next_report_ns = start_ns + _REPORT_INTERVAL_NS
         frames_to_read = args.frames if args.frames >= 0 else float("inf")
         frame_index = 0
 
+        # Bind loop-invariant options and lookups to locals before the hot loop
+        read_frames = reader.read_frames
+        timeout = args.timeout_ms / 1000.0 if args.timeout_ms else None
+        max_batch = max(1, args.batch_size)
+        expected_size = args.size
+        verify_pattern = args.verify
+        verify_on = verify_pattern != "none"
+        verbose = args.verbose and not args.json_output
+        errors = result["errors"]
+        hasher = blake3 if args.hash == "blake3" else getattr(hashlib, args.hash)
+        verify = verify_frame_data
+        monotonic_ns = time.monotonic_ns
+
+        # Only the first frames' checksums are stored, so the list can be sized up front
+        checksum_slots = int(min(_MAX_STORED_CHECKSUMS, frames_to_read)) if args.checksum else 0
+        checksums: List[Optional[Dict[str, Any]]] = [None] * checksum_slots
+
         while frame_index < frames_to_read:
             try:
-                # Read frame with timeout
-                frame = reader.read_frame(timeout=args.timeout_ms / 1000.0 if args.timeout_ms else None)
+                # Read a batch of frames with timeout
+                frames = read_frames(max(1, min(max_batch, frames_to_read - frame_index)), timeout=timeout)
 
-                if frame is None:
+                if not frames:
                     # Timeout or no more frames
-                    if args.verbose and not args.json_output:
+                    if verbose:
                         print(f"No more frames after {frame_index}")
                     break
 
-                # Verify frame size
-                if len(frame) != args.size:
-                    result["errors"].append(f"Frame {frame_index}: Expected size {args.size}, got {len(frame)}")
+                for frame in frames:
+                    with frame:
+                        # Verify frame size
+                        if len(frame) != expected_size:
+                            errors.append(f"Frame {frame_index}: Expected size {expected_size}, got {len(frame)}")
 
-                # Verify data pattern if requested
-                if args.verify != "none":
-                    if not verify_frame_data(bytes(frame.data), frame_index, args.verify):
-                        result["verification_errors"] += 1
-                        if args.verbose and not args.json_output:
-                            print(f"Frame {frame_index}: Verification failed")
+                        # Verify data pattern if requested
+                        if verify_on:
+                            if not verify(frame.data, frame_index, verify_pattern):
+                                result["verification_errors"] += 1
+                                if verbose:
+                                    print(f"Frame {frame_index}: Verification failed")
 
-                # Calculate checksum if requested
-                if args.checksum:
-                    checksum = hashlib.md5(bytes(frame.data)).hexdigest()
-                    if len(result["checksums"]) < 100:  # Limit stored checksums
-                        result["checksums"].append({"frame": frame_index, "checksum": checksum})
+                        # Calculate checksum if it will be stored (hash the memoryview directly - no copy)
+                        if frame_index < checksum_slots:
+                            checksums[frame_index] = {"frame": frame_index, "checksum": hasher(frame.data).hexdigest()}
 
-                frame_index += 1
-                result["frames_read"] = frame_index
+                    frame_index += 1
 
-                if args.verbose and not args.json_output and frame_index % 100 == 0:
-                    print(f"Read {frame_index} frames...")
+                    # Sample the clock only every 1024 frames, report at most once per interval
+                    if verbose and not frame_index & _REPORT_CHECK_MASK:
+                        now_ns = monotonic_ns()
+                        if now_ns >= next_report_ns:
+                            print(f"Read {frame_index} frames...")
+                            next_report_ns = now_ns + _REPORT_INTERVAL_NS
 
             except Exception as e:
-                result["errors"].append(f"Frame {frame_index}: {str(e)}")
+                errors.append(f"Frame {frame_index}: {str(e)}")
                 break
 
-        end_time = time.time()
-        duration = end_time - start_time
+        result["frames_read"] = frame_index
+        del checksums[frame_index:]
+        result["checksums"] = checksums
+
+        duration = (time.monotonic_ns() - start_ns) / 1e9
         result["duration_seconds"] = duration
 
         # Calculate throughput
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+ZeroBuffer cross-platform test relay.
+
+Reads frames from one buffer and writes them to another with standardized command-line interface.
+"""
+
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from zerobuffer import (
+    BufferConfig,
+    Frame,
+    Reader,
+    Writer,
+    WriterAlreadyConnectedException,
+    WriterDeadException,
+    ZeroBufferException,
+)
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    # numpy is optional - transforms fall back to pure Python
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # orjson is optional - results are serialized with the standard json module
+    ORJSON_AVAILABLE = False
+
+FrameData = Union[bytes, memoryview]
+Transform = Callable[[FrameData], FrameData]
+
+# Input buffer layout (matches the C# relay)
+_INPUT_METADATA_SIZE = 4096
+
+# Output buffer is created by its reader - retry connecting for up to 5 seconds,
+# backing off from 1 ms so a buffer that is nearly ready is picked up quickly
+_CONNECT_TIMEOUT = 5.0
+_CONNECT_MIN_DELAY = 0.001
+_CONNECT_MAX_DELAY = 0.1
+
+
+@lru_cache(maxsize=8)
+def _xor_mask(xor_key: int, size: int) -> int:
+    """XOR key repeated over size bytes as one integer, for word-wide XOR without numpy."""
+    return int.from_bytes(bytes([xor_key]) * size, "little")
+
+
+def _identity(data: FrameData) -> FrameData:
+    return data
+
+
+def _reverse(data: FrameData) -> FrameData:
+    if NUMPY_AVAILABLE:
+        # Negative-stride view over the frame - no copy until the writer copies it into the output buffer
+        return memoryview(np.frombuffer(data, dtype=np.uint8)[::-1])
+    return bytes(data)[::-1]
+
+
+def _make_xor(xor_key: int) -> Transform:
+    if NUMPY_AVAILABLE:
+        key = np.uint8(xor_key)
+        # Output buffer reused across frames, grown to fit the largest frame seen
+        scratch = np.empty(0, dtype=np.uint8)
+
+        def _xor(data: FrameData) -> FrameData:
+            nonlocal scratch
+            size = len(data)
+            if size > len(scratch):
+                scratch = np.empty(max(size, 2 * len(scratch)), dtype=np.uint8)
+            out = scratch[:size]
+            # Vectorized XOR over the whole frame instead of one bytecode per byte, into the reused buffer
+            np.bitwise_xor(np.frombuffer(data, dtype=np.uint8), key, out=out)
+            return memoryview(out)
+
+    else:
+
+        def _xor(data: FrameData) -> FrameData:
+            # Without numpy, XOR the frame as one big integer - CPython processes it a machine word at a time
+            size = len(data)
+            return (int.from_bytes(data, "little") ^ _xor_mask(xor_key, size)).to_bytes(size, "little")
+
+    return _xor
+
+
+def make_transform(transform: str, xor_key: int) -> Transform:
+    """
+    Select the transformation function once, before relaying.
+
+    The returned function reads the frame memoryview in place; its result may
+    be a view that borrows from it or from a buffer reused by the next call, so
+    it must be written out before the frame is released or another frame is
+    transformed.
+    """
+    if transform == "none":
+        return _identity
+    elif transform == "reverse":
+        return _reverse
+    elif transform == "xor":
+        return _make_xor(xor_key)
+    else:
+        raise ValueError(f"Unknown transform: {transform}")
+
+
+class WritePipeline:
+    """
+    Relays frames on a background thread so reading the next frames overlaps writing the current one.
+
+    Frames are written and released on the pipeline thread in the order they were queued. At most
+    depth frames wait in the queue, which bounds how much of the input buffer is held.
+    """
+
+    def __init__(self, relay_frame: Callable[[Frame], None], depth: int) -> None:
+        self._relay_frame = relay_frame
+        self._queue: "queue.Queue[Optional[Frame]]" = queue.Queue(maxsize=depth)
+        self._error: Optional[Exception] = None
+        self._thread = threading.Thread(target=self._run, name="relay-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, frame: Frame) -> None:
+        """
+        Queue a frame for writing, blocking while the queue is full.
+
+        Raises:
+            Exception: The error that stopped the pipeline thread, if any
+        """
+        if self._error is not None:
+            frame.dispose()
+            raise self._error
+        self._queue.put(frame)
+
+    def close(self) -> None:
+        """
+        Wait for all queued frames to be written and stop the pipeline thread.
+
+        Raises:
+            Exception: The error that stopped the pipeline thread, if any
+        """
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        get = self._queue.get
+        while True:
+            frame = get()
+            if frame is None:
+                return
+            if self._error is not None:
+                # Keep draining so the reading side never blocks on a full queue
+                frame.dispose()
+                continue
+            try:
+                self._relay_frame(frame)
+            except Exception as e:
+                self._error = e
+                frame.dispose()
+
+
+def connect_writer(buffer_name: str, verbose: bool) -> Writer:
+    """Connect to the output buffer, waiting for its reader to create it."""
+    deadline = time.monotonic() + _CONNECT_TIMEOUT
+    delay = _CONNECT_MIN_DELAY
+    while True:
+        try:
+            return Writer(buffer_name)
+        except WriterAlreadyConnectedException:
+            # Waiting won't help - another writer owns the buffer
+            raise
+        except ZeroBufferException:
+            # Buffer (or its semaphores) not created yet
+            if time.monotonic() >= deadline:
+                raise ZeroBufferException(f"Timeout waiting for output buffer {buffer_name}")
+            if delay == _CONNECT_MIN_DELAY and verbose:
+                print(f"[RELAY] Waiting for output buffer {buffer_name} to be created...")
+            time.sleep(delay)
+            delay = min(delay * 2, _CONNECT_MAX_DELAY)
+
+
+def print_json(result: Dict[str, Any]) -> None:
+    """Print the JSON result to stdout."""
+    if ORJSON_AVAILABLE:
+        # orjson produces UTF-8 bytes - write them directly, after any text already buffered
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(result, indent=2))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Relay frames between ZeroBuffers for testing",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    parser.add_argument("input_buffer", help="Name of the buffer to read from")
+    parser.add_argument("output_buffer", help="Name of the buffer to write to")
+    parser.add_argument(
+        "-n", "--frames", type=int, default=0, help="Number of frames to relay (default: 0 for unlimited)"
+    )
+    parser.add_argument(
+        "--create-output",
+        action="store_true",
+        help="Wait for the output buffer to be created (it is always owned by its reader)",
+    )
+    parser.add_argument(
+        "--buffer-size",
+        type=int,
+        default=256 * 1024 * 1024,
+        help="Input buffer payload size in bytes (default: 256MB)",
+    )
+    parser.add_argument(
+        "--timeout-ms", type=int, default=5000, help="Timeout per frame in milliseconds (default: 5000)"
+    )
+    parser.add_argument(
+        "--transform",
+        choices=["none", "reverse", "xor"],
+        default="none",
+        help="Apply transformation (default: none)",
+    )
+    parser.add_argument("--xor-key", type=int, default=255, help="XOR key for transform (default: 255)")
+    parser.add_argument(
+        "--batch-size", type=int, default=8, help="Relay up to N already-written frames per read (default: 8)"
+    )
+    parser.add_argument(
+        "--pipeline-depth",
+        type=int,
+        default=0,
+        help="Write frames on a separate thread with up to N frames queued (default: 0, relay on one thread)",
+    )
+    parser.add_argument("--log-interval", type=int, default=100, help="Log progress every N frames (default: 100)")
+    parser.add_argument("--json-output", action="store_true", help="Output results in JSON format")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+
+    args = parser.parse_args()
+
+    if not 0 <= args.xor_key <= 255:
+        parser.error("--xor-key must be between 0 and 255")
+    if args.log_interval <= 0:
+        parser.error("--log-interval must be positive")
+    if args.batch_size <= 0:
+        parser.error("--batch-size must be positive")
+    if args.pipeline_depth < 0:
+        parser.error("--pipeline-depth must not be negative")
+
+    result: Dict[str, Any] = {
+        "operation": "relay",
+        "input_buffer": args.input_buffer,
+        "output_buffer": args.output_buffer,
+        "frames_relayed": 0,
+        "metadata_relayed": False,
+        "metadata_size": 0,
+        "total_bytes": 0,
+        "duration_seconds": 0.0,
+        "throughput_mbps": 0.0,
+        "errors": [],
+    }
+
+    verbose = args.verbose and not args.json_output
+
+    try:
+        config = BufferConfig(metadata_size=_INPUT_METADATA_SIZE, payload_size=args.buffer_size)
+        with Reader(args.input_buffer, config) as reader:
+            if verbose:
+                print(f"[RELAY] Created input buffer: {args.input_buffer}")
+
+            # Bind loop-invariant options and lookups to locals before the hot loop
+            read_frames = reader.read_frames
+            timeout = args.timeout_ms / 1000.0
+            max_batch = args.batch_size
+            frames_to_relay = args.frames if args.frames > 0 else float("inf")
+
+            # Connect downstream while waiting for the first upstream frames - neither depends on the other
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                connecting = pool.submit(connect_writer, args.output_buffer, verbose)
+                pending: Optional[List[Frame]]
+                try:
+                    pending = read_frames(int(min(max_batch, frames_to_relay)), timeout=timeout)
+                except WriterDeadException:
+                    pending = []
+                writer = connecting.result()
+
+            if verbose:
+                print(f"[RELAY] Connected to output buffer: {args.output_buffer}")
+
+            with writer:
+                frames_relayed = 0
+                total_bytes = 0
+
+                # Metadata is written before the first frame - forward it once, before relaying any
+                if pending:
+                    metadata = reader.get_metadata()
+                    if metadata is not None:
+                        writer.set_metadata(metadata)
+                        result["metadata_relayed"] = True
+                        result["metadata_size"] = len(metadata)
+                        metadata.release()
+
+                write_frame = writer.write_frame
+                transform = make_transform(args.transform, args.xor_key)
+
+                def relay_frame(frame: Frame) -> None:
+                    with frame:
+                        write_frame(transform(frame.data))
+
+                pipeline = WritePipeline(relay_frame, args.pipeline_depth) if args.pipeline_depth else None
+                relay = pipeline.put if pipeline is not None else relay_frame
+                log_interval = args.log_interval
+                frames_until_log = log_interval
+
+                monotonic_ns = time.monotonic_ns
+                start_ns = monotonic_ns()
+
+                while frames_relayed < frames_to_relay:
+                    try:
+                        if pending is not None:
+                            frames, pending = pending, None
+                        else:
+                            # Wait for the next frame, then take any others already written in the same call
+                            frames = read_frames(int(min(max_batch, frames_to_relay - frames_relayed)), timeout=timeout)
+                        if not frames:
+                            if verbose:
+                                print(f"[RELAY] No more frames after {frames_relayed} frames")
+                            break
+
+                        handed_over = 0
+                        try:
+                            for frame in frames:
+                                # relay owns the frame from here on and disposes it even if it raises
+                                handed_over += 1
+                                total_bytes += frame.size
+                                relay(frame)
+                                frames_relayed += 1
+
+                                # Count down to the next progress report instead of taking a modulo per frame
+                                frames_until_log -= 1
+                                if not frames_until_log:
+                                    frames_until_log = log_interval
+                                    if verbose:
+                                        elapsed_ns = monotonic_ns() - start_ns
+                                        total_mb = total_bytes / (1024.0 * 1024.0)
+                                        throughput = total_mb * 1e9 / elapsed_ns if elapsed_ns > 0 else 0
+                                        print(
+                                            f"[RELAY] Progress: {frames_relayed} frames, {total_mb:.2f}MB, "
+                                            f"{throughput:.2f}MB/s"
+                                        )
+                        finally:
+                            # A failed relay ends the batch - release the input space of the frames it never reached
+                            for frame in frames[handed_over:]:
+                                frame.dispose()
+
+                    except WriterDeadException:
+                        if verbose:
+                            print(f"[RELAY] Input writer disconnected after {frames_relayed} frames")
+                        break
+                    except Exception as e:
+                        result["errors"].append(f"Frame {frames_relayed}: {str(e)}")
+                        break
+
+                if pipeline is not None:
+                    try:
+                        pipeline.close()
+                    except Exception as e:
+                        if not result["errors"]:
+                            result["errors"].append(f"Frame {writer.frames_written}: {str(e)}")
+
+                duration = (monotonic_ns() - start_ns) / 1e9
+
+                # Count what actually reached the output buffer
+                frames_relayed = writer.frames_written
+                total_bytes = writer.bytes_written
+
+            result["frames_relayed"] = frames_relayed
+            result["total_bytes"] = total_bytes
+            result["duration_seconds"] = duration
+
+            total_mb = total_bytes / (1024.0 * 1024.0)
+            result["throughput_mbps"] = total_mb / duration if duration > 0 else 0
+
+            if not args.json_output:
+                print(f"Relayed {frames_relayed} frames in {duration:.2f} seconds")
+                print(f"Throughput: {result['throughput_mbps']:.2f} MB/s")
+
+    except Exception as e:
+        result["errors"].append(str(e))
+
+        if args.json_output:
+            print_json(result)
+        else:
+            print(f"[RELAY] Error: {e}", file=sys.stderr)
+
+        return 2
+
+    if args.json_output:
+        print_json(result)
+
+    return 0 if not result["errors"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,19 +10,35 @@ import json
 import sys
 import time
 import random
+from functools import lru_cache
+from typing import Iterator, Union
 
 from zerobuffer import Writer
 
+# Patterns whose content does not depend on the frame index
+_CONSTANT_PATTERNS = ("zero", "ones")
 
-def fill_frame_data(data: bytearray, frame_index: int, pattern: str) -> None:
+# Frames from this size on are generated directly in shared memory - below it, the extra copy out of
+# a local buffer costs less than the separate get_frame_buffer/commit_frame calls
+_ZERO_COPY_MIN_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=8)
+def _sequential_block(size: int) -> bytes:
+    """Bytes 0..255 repeated, long enough to slice a frame of size bytes at any starting offset."""
+    return bytes(range(256)) * (size // 256 + 2)
+
+
+def fill_frame_data(data: Union[bytearray, memoryview], frame_index: int, pattern: str) -> None:
     """Fill frame data with specified pattern."""
     if pattern == "sequential":
-        for i in range(len(data)):
-            data[i] = (frame_index + i) % 256
+        # One slice copy instead of a per-byte loop
+        start = frame_index % 256
+        data[:] = memoryview(_sequential_block(len(data)))[start : start + len(data)]
     elif pattern == "random":
+        # Seeded with the frame index so the reader can regenerate it; all bytes come from one draw
         random.seed(frame_index)
-        for i in range(len(data)):
-            data[i] = random.randint(0, 255)
+        data[:] = random.getrandbits(len(data) * 8).to_bytes(len(data), "little")
     elif pattern == "zero":
         data[:] = b"\x00" * len(data)
     elif pattern == "ones":
@@ -85,19 +101,48 @@ def main() -> int:
             if args.verbose and not args.json_output:
                 print(f"Wrote metadata: {len(metadata)} bytes")
 
-        # Prepare frame data
+        # Prepare frame data - constant patterns are filled once, not regenerated for every frame
         frame_data = bytearray(args.size)
-
-        # Write frames
+        refill = args.pattern not in _CONSTANT_PATTERNS
+        if not refill:
+            fill_frame_data(frame_data, 0, args.pattern)
+
+        def batch_frames(start: int, end: int) -> Iterator[bytearray]:
+            # write_frames copies each frame before taking the next, so one buffer serves the whole batch
+            for i in range(start, end):
+                if refill:
+                    fill_frame_data(frame_data, i, args.pattern)
+                yield frame_data
+
+        def write_frame_in_place(frame_index: int) -> None:
+            # get_frame_buffer holds the writer lock until commit_frame - commit even if filling fails,
+            # so the error is reported instead of leaving the writer locked
+            buffer = writer.get_frame_buffer(args.size)
+            try:
+                if refill:
+                    fill_frame_data(buffer, frame_index, args.pattern)
+                else:
+                    buffer[:] = frame_data
+            finally:
+                writer.commit_frame()
+
+        # Write frames - each batch takes the writer lock once and flushes shared memory once.
+        # The delay is between frames, so a paced run writes frames one at a time
+        batch_size = max(1, args.batch_size) if args.delay_ms <= 0 else 1
+        zero_copy = args.size >= _ZERO_COPY_MIN_SIZE
         start_time = time.time()
 
-        for i in range(args.frames):
-            fill_frame_data(frame_data, i, args.pattern)
-            writer.write_frame(bytes(frame_data))
-            result["frames_written"] = i + 1
-
-            if args.verbose and not args.json_output and (i + 1) % 100 == 0:
-                print(f"Wrote {i + 1} frames...")
+        for batch_start in range(0, args.frames, batch_size):
+            batch_end = min(batch_start + batch_size, args.frames)
+            if zero_copy:
+                for i in range(batch_start, batch_end):
+                    write_frame_in_place(i)
+            else:
+                writer.write_frames(batch_frames(batch_start, batch_end))
+            result["frames_written"] = batch_end
+
+            if args.verbose and not args.json_output and batch_end // 100 > batch_start // 100:
+                print(f"Wrote {batch_end} frames...")
 
             if args.delay_ms > 0:
                 time.sleep(args.delay_ms / 1000.0)
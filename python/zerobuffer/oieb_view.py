@@ -132,12 +132,14 @@ class OIEBView:
     - 96-127: reserved (4 x uint64)
     """
 
-    __slots__ = ["_shm", "_version", "_ctypes_buf", "_base_addr"]  # Prevent dict, save memory
+    __slots__ = ["_shm", "_version", "_ctypes_buf", "_base_addr", "_disposed"]  # Prevent dict, save memory
     _shm: Optional[memoryview]
 
     # Field definitions: (offset, size, format)
     _UINT32_FMT = "<I"
     _UINT64_FMT = "<Q"
+    # payload_size, (skip payload_free_bytes), payload_write_pos, payload_read_pos
+    _SIZE_AND_POSITIONS = struct.Struct("<Q8xQQ")
 
     # Offsets for each field
     _OIEB_SIZE_OFFSET = 0
@@ -165,6 +167,7 @@ class OIEBView:
         """
         if len(shared_memory) < self.SIZE:
             raise ValueError(f"Shared memory too small: {len(shared_memory)} < {self.SIZE}")
+        self._disposed = False
         self._shm: Optional[memoryview] = shared_memory
         self._version = ProtocolVersion(self._shm, self._VERSION_OFFSET)
 
@@ -312,13 +315,15 @@ class OIEBView:
     @property
     def used_bytes(self) -> int:
         """Calculate used bytes in buffer"""
-        write_pos = self.payload_write_pos
-        read_pos = self.payload_read_pos
-        size = self.payload_size
-
-        if write_pos >= read_pos:
-            return write_pos - read_pos
-        return size - read_pos + write_pos
+        if self._shm is None:
+            raise ValueError("OIEBView has been disposed")
+        # Single unpack of the three fields instead of three property reads
+        size, write_pos, read_pos = self._SIZE_AND_POSITIONS.unpack_from(self._shm, self._PAYLOAD_SIZE_OFFSET)
+        if size == 0:
+            return 0
+        # Both positions are < size, so the modulo yields the wrapped distance without a wrap-around branch
+        result: int = (write_pos - read_pos) % size
+        return result
 
     def has_space_for(self, frame_size: int) -> bool:
         """Check if buffer has space for frame"""
@@ -393,15 +398,23 @@ class OIEBView:
         # Reserved fields are left as-is (should be zero)
 
     def dispose(self) -> None:
-        """Release the memoryview reference to allow proper cleanup"""
+        """Release the memoryview reference to allow proper cleanup (safe to call more than once)"""
+        if self._disposed:
+            return
+        self._disposed = True
+
         # Release ctypes buffer BEFORE releasing memoryview
         # (ctypes buffer holds a reference to the memoryview's buffer)
-        if hasattr(self, "_ctypes_buf"):
-            self._ctypes_buf = None
-            self._base_addr = 0
-        if hasattr(self, "_shm") and self._shm is not None:
+        # All slots are assigned in __init__, so no hasattr checks are needed
+        self._ctypes_buf = None
+        self._base_addr = 0
+        if self._shm is not None:
             # Properly release the memoryview
-            self._shm.release()
+            try:
+                self._shm.release()
+            except BufferError:
+                # Still exported elsewhere - it is released once the last export goes away
+                pass
             self._shm = None
 
     def __repr__(self) -> str:
@@ -6,7 +6,8 @@ Provides zero-copy reading from shared memory buffers.
 
 import os
 import threading
-from typing import Optional, Any
+from collections import deque
+from typing import Deque, List, Optional, Any, Tuple
 from pathlib import Path
 import logging
 
@@ -44,9 +45,8 @@ class Reader:
         self._frames_read = 0
         self._bytes_read = 0
         self._current_frame_size = 0
-        self._frame_disposal_data: Optional[tuple[int, int]] = (
-            None  # Will store (total_frame_size, sequence) for cached callback
-        )
+        # (total_frame_size, sequence) per outstanding frame, in read order, for the cached callback
+        self._frame_disposal_data: Deque[Tuple[int, int]] = deque()
         self._oieb: Optional[OIEBView] = None  # Will be initialized after shm is created
 
         logger.debug("Creating Reader with name=%s, config=%s", name, self._config)
@@ -191,13 +191,13 @@ class Reader:
         """
         Cached callback for frame disposal - avoids per-frame allocations.
         This method is called when a Frame is disposed (via with statement or explicit dispose).
-        The frame data is stored in _frame_disposal_data before creating the Frame.
+        The frame data is queued in _frame_disposal_data before creating the Frame;
+        frames are released in the order they were read.
         """
-        if self._frame_disposal_data is None:
+        if not self._frame_disposal_data:
             return
 
-        total_frame_size, sequence = self._frame_disposal_data
-        self._frame_disposal_data = None  # Clear for next frame
+        total_frame_size, sequence = self._frame_disposal_data.popleft()
 
         # Check if the reader is still open before trying to release semaphore
         if self._closed:
@@ -311,119 +311,163 @@ class Reader:
                         self._oieb.payload_size,
                     )
 
-                # Read frame header
-                if not self._oieb:
-                    raise ZeroBufferException("Reader not properly initialized")
+                return self._read_next_frame()
 
-                payload_base = self._oieb_size + self._metadata_size
-                header_offset = payload_base + self._oieb.payload_read_pos
-                header_data = self._shm.read_bytes(header_offset, FrameHeader.SIZE)
-                header = FrameHeader.unpack(header_data)
+    def read_frames(self, max_frames: int, timeout: Optional[float] = 5.0) -> List[Frame]:
+        """
+        Read up to max_frames frames in a single call (zero-copy)
 
-                # Check for wrap-around marker
-                if header.payload_size == 0:
-                    # This is a wrap marker
-                    logger.debug("Found wrap marker at position %d, handling wrap-around", self._oieb.payload_read_pos)
+        Blocks for the first frame like read_frame(), then drains frames the
+        writer has already signaled without waiting again. Frames should be
+        released in the order they are returned.
 
-                    # Calculate wasted space from current read position to end of buffer
-                    wasted_space = self._oieb.payload_size - self._oieb.payload_read_pos
-                    logger.debug(
-                        "Wrap-around: wasted space = %d bytes (from %d to %d)",
-                        wasted_space,
-                        self._oieb.payload_read_pos,
-                        self._oieb.payload_size,
-                    )
+        Args:
+            max_frames: Maximum number of frames to return
+            timeout: Timeout in seconds for the first frame, None for infinite
+
+        Returns:
+            List of Frame objects, empty if timeout
+
+        Raises:
+            ValueError: If max_frames is not positive
+            WriterDeadException: If writer process died
+            SequenceError: If sequence number is invalid
+        """
+        if max_frames <= 0:
+            raise ValueError("max_frames must be positive")
 
-                    # Add back the wasted space to free bytes - atomic to prevent lost updates
-                    self._oieb.atomic_add_payload_free_bytes(wasted_space)
+        with self._lock:
+            frame = self.read_frame(timeout)
+            if frame is None:
+                return []
 
-                    # Move to beginning of buffer
-                    self._oieb.payload_read_pos = 0
-                    self._oieb.payload_read_count += 1  # Count the wrap marker as a "frame"
+            frames = [frame]
+            while len(frames) < max_frames and self._sem_write.acquire(0):
+                frames.append(self._read_next_frame())
 
-                    logger.debug(
-                        "After wrap: ReadPos=0, ReadCount=%d, FreeBytes=%d",
-                        self._oieb.payload_read_count,
-                        self._oieb.payload_free_bytes,
-                    )
+            logger.debug("ReadFrames returned %d frames", len(frames))
+            return frames
 
-                    # Don't signal semaphore for wrap marker - it's not a logical frame
-                    # The space freed by the wrap marker will be signaled when the actual frame is disposed
-
-                    # Now read the actual frame at the beginning without waiting for another semaphore
-                    # The writer wrote both the wrap marker and the frame before signaling
-                    header_offset = payload_base  # Start of buffer
-                    header_data = self._shm.read_bytes(header_offset, FrameHeader.SIZE)
-                    header = FrameHeader.unpack(header_data)
-
-                # Validate sequence number
-                if header.sequence_number != self._expected_sequence:
-                    logger.error("Sequence error: expected %d, got %d", self._expected_sequence, header.sequence_number)
-                    raise SequenceError(self._expected_sequence, header.sequence_number)
-
-                # Validate frame size
-                if header.payload_size == 0:
-                    logger.error("Invalid frame size: 0")
-                    raise ZeroBufferException("Invalid frame size: 0")
-
-                total_frame_size = FrameHeader.SIZE + header.payload_size
-
-                logger.debug(
-                    "Reading frame: seq=%d, size=%d from position %d",
-                    header.sequence_number,
-                    header.payload_size,
-                    self._oieb.payload_read_pos,
-                )
-
-                # Frame must not extend past buffer boundary — writer must always place wrap markers
-                if self._oieb.payload_read_pos + total_frame_size > self._oieb.payload_size:
-                    raise ZeroBufferException(
-                        f"Frame extends past buffer boundary: readPos={self._oieb.payload_read_pos}"
-                        f", frameSize={total_frame_size}, payloadSize={self._oieb.payload_size}"
-                        f", writePos={self._oieb.payload_write_pos}"
-                    )
+    def _read_next_frame(self) -> Frame:
+        """
+        Read the frame at the current read position
 
-                # Update OIEB read position and count (but NOT free bytes yet!)
-                old_pos = self._oieb.payload_read_pos
-                self._oieb.payload_read_pos += total_frame_size
-                if self._oieb.payload_read_pos >= self._oieb.payload_size:
-                    self._oieb.payload_read_pos -= self._oieb.payload_size
-                self._oieb.payload_read_count += 1
-                # NOTE: We do NOT update payload_free_bytes here!
-                # This will be done when the Frame is disposed (RAII pattern)
-
-                logger.debug(
-                    "Frame read: seq=%d, new state: ReadCount=%d, ReadPos=%d",
-                    header.sequence_number,
-                    self._oieb.payload_read_count,
-                    self._oieb.payload_read_pos,
-                )
-
-                # Flush after reading frame and updating OIEB (matching C# line 408)
-                self._shm.flush()
+        Must be called with the lock held, after the write semaphore has been
+        acquired for this frame.
+        """
+        # Read frame header
+        if not self._oieb:
+            raise ZeroBufferException("Reader not properly initialized")
+
+        payload_base = self._oieb_size + self._metadata_size
+        header_offset = payload_base + self._oieb.payload_read_pos
+        header_data = self._shm.read_bytes(header_offset, FrameHeader.SIZE)
+        header = FrameHeader.unpack(header_data)
+
+        # Check for wrap-around marker
+        if header.payload_size == 0:
+            # This is a wrap marker
+            logger.debug("Found wrap marker at position %d, handling wrap-around", self._oieb.payload_read_pos)
+
+            # Calculate wasted space from current read position to end of buffer
+            wasted_space = self._oieb.payload_size - self._oieb.payload_read_pos
+            logger.debug(
+                "Wrap-around: wasted space = %d bytes (from %d to %d)",
+                wasted_space,
+                self._oieb.payload_read_pos,
+                self._oieb.payload_size,
+            )
+
+            # Add back the wasted space to free bytes - atomic to prevent lost updates
+            self._oieb.atomic_add_payload_free_bytes(wasted_space)
+
+            # Move to beginning of buffer
+            self._oieb.payload_read_pos = 0
+            self._oieb.payload_read_count += 1  # Count the wrap marker as a "frame"
+
+            logger.debug(
+                "After wrap: ReadPos=0, ReadCount=%d, FreeBytes=%d",
+                self._oieb.payload_read_count,
+                self._oieb.payload_free_bytes,
+            )
+
+            # Don't signal semaphore for wrap marker - it's not a logical frame
+            # The space freed by the wrap marker will be signaled when the actual frame is disposed
+
+            # Now read the actual frame at the beginning without waiting for another semaphore
+            # The writer wrote both the wrap marker and the frame before signaling
+            header_offset = payload_base  # Start of buffer
+            header_data = self._shm.read_bytes(header_offset, FrameHeader.SIZE)
+            header = FrameHeader.unpack(header_data)
+
+        # Validate sequence number
+        if header.sequence_number != self._expected_sequence:
+            logger.error("Sequence error: expected %d, got %d", self._expected_sequence, header.sequence_number)
+            raise SequenceError(self._expected_sequence, header.sequence_number)
+
+        # Validate frame size
+        if header.payload_size == 0:
+            logger.error("Invalid frame size: 0")
+            raise ZeroBufferException("Invalid frame size: 0")
+
+        total_frame_size = FrameHeader.SIZE + header.payload_size
+
+        logger.debug(
+            "Reading frame: seq=%d, size=%d from position %d",
+            header.sequence_number,
+            header.payload_size,
+            self._oieb.payload_read_pos,
+        )
+
+        # Frame must not extend past buffer boundary — writer must always place wrap markers
+        if self._oieb.payload_read_pos + total_frame_size > self._oieb.payload_size:
+            raise ZeroBufferException(
+                f"Frame extends past buffer boundary: readPos={self._oieb.payload_read_pos}"
+                f", frameSize={total_frame_size}, payloadSize={self._oieb.payload_size}"
+                f", writePos={self._oieb.payload_write_pos}"
+            )
+
+        # Update OIEB read position and count (but NOT free bytes yet!)
+        old_pos = self._oieb.payload_read_pos
+        self._oieb.payload_read_pos += total_frame_size
+        if self._oieb.payload_read_pos >= self._oieb.payload_size:
+            self._oieb.payload_read_pos -= self._oieb.payload_size
+        self._oieb.payload_read_count += 1
+        # NOTE: We do NOT update payload_free_bytes here!
+        # This will be done when the Frame is disposed (RAII pattern)
+
+        logger.debug(
+            "Frame read: seq=%d, new state: ReadCount=%d, ReadPos=%d",
+            header.sequence_number,
+            self._oieb.payload_read_count,
+            self._oieb.payload_read_pos,
+        )
+
+        # Flush after reading frame and updating OIEB (matching C# line 408)
+        self._shm.flush()
+
+        # Queue frame disposal data for the cached callback
+        # This avoids creating a new lambda/closure for each frame
+        self._frame_disposal_data.append((total_frame_size, header.sequence_number))
+
+        # Create frame reference (zero-copy) with cached disposal callback
+        # Get a fresh memoryview for the payload area
+        payload_view = self._shm.get_memoryview(payload_base, self._payload_size)
+        frame = Frame(
+            memory_view=payload_view,
+            offset=old_pos + FrameHeader.SIZE,  # Use old_pos since we already updated
+            size=header.payload_size,
+            sequence=header.sequence_number,
+            on_dispose=self._on_frame_disposed,  # Use cached method - no allocation!
+        )
+
+        # Update tracking
+        self._current_frame_size = total_frame_size
+        self._expected_sequence += 1
+        self._frames_read += 1
+        self._bytes_read += header.payload_size
 
-                # Store frame disposal data for the cached callback
-                # This avoids creating a new lambda/closure for each frame
-                self._frame_disposal_data = (total_frame_size, header.sequence_number)
-
-                # Create frame reference (zero-copy) with cached disposal callback
-                # Get a fresh memoryview for the payload area
-                payload_view = self._shm.get_memoryview(payload_base, self._payload_size)
-                frame = Frame(
-                    memory_view=payload_view,
-                    offset=old_pos + FrameHeader.SIZE,  # Use old_pos since we already updated
-                    size=header.payload_size,
-                    sequence=header.sequence_number,
-                    on_dispose=self._on_frame_disposed,  # Use cached method - no allocation!
-                )
-
-                # Update tracking
-                self._current_frame_size = total_frame_size
-                self._expected_sequence += 1
-                self._frames_read += 1
-                self._bytes_read += header.payload_size
-
-                return frame
+        return frame
 
     def release_frame(self, frame: Frame) -> None:
         """
@@ -7,6 +7,7 @@ read/write semantics, delegating to platform-specific implementations.
 
 import struct
 import sys
+from typing import Union
 
 # Import platform-specific implementation
 if sys.platform == "linux":
@@ -70,7 +71,7 @@ class SharedMemory:
         buf = self._impl.get_buffer()
         return bytes(buf[offset : offset + length])
 
-    def write_bytes(self, offset: int, data: bytes) -> None:
+    def write_bytes(self, offset: int, data: Union[bytes, bytearray, memoryview]) -> None:
         """
         Write bytes to shared memory.
 
@@ -7,7 +7,7 @@ Provides zero-copy writing to shared memory buffers.
 import os
 import threading
 from datetime import timedelta
-from typing import Optional, Union, Any
+from typing import Any, Iterable, Optional, Union
 import logging
 
 from . import platform
@@ -54,6 +54,7 @@ class Writer:
         self._sequence_number = 1
         self._frames_written = 0
         self._bytes_written = 0
+        self._unsignaled_frames = 0  # Frames written to shared memory but not yet signaled to the reader
         self._metadata_written = False
         self._write_timeout = timedelta(seconds=5)  # Default timeout
         self._oieb: Optional[OIEBView] = None  # Will be initialized after shm is opened
@@ -88,6 +89,11 @@ class Writer:
             if self._oieb.writer_pid != 0 and platform.process_exists(self._oieb.writer_pid):
                 raise WriterAlreadyConnectedException()
 
+            # Open semaphores before claiming the buffer - the reader creates them after setting its PID,
+            # so a failed attempt here must not leave our PID behind for the next one to trip over
+            self._sem_write = platform.open_semaphore(f"sem-w-{name}")
+            self._sem_read = platform.open_semaphore(f"sem-r-{name}")
+
             # Set writer PID directly in shared memory (OIEBView updates immediately)
             self._oieb.writer_pid = os.getpid()
             logger.debug("Set writer PID=%d directly in OIEB shared memory", self._oieb.writer_pid)
@@ -98,10 +104,6 @@ class Writer:
             self._metadata_size = self._oieb.metadata_size
             self._payload_size = self._oieb.payload_size
 
-            # Open semaphores
-            self._sem_write = platform.open_semaphore(f"sem-w-{name}")
-            self._sem_read = platform.open_semaphore(f"sem-r-{name}")
-
             # Check if metadata was already written
             self._metadata_written = self._oieb.metadata_written_bytes > 0
 
@@ -226,124 +228,190 @@ class Writer:
             FrameTooLargeException: If frame is too large for buffer
             ReaderDeadException: If reader process died
         """
-        if len(data) == 0:
-            raise InvalidFrameSizeException()
-
+        data = self._frame_bytes(data)
         logger.debug("WriteFrame called with data size=%d", len(data))
 
         with self._lock:
-            if self._closed:
-                raise ZeroBufferException("Writer is closed")
+            self._check_writable()
+            self._write_frame_locked(data)
+            self._signal_written_frames()
 
-            if not self._oieb:
-                raise ZeroBufferException("Writer not properly initialized")
-
-            frame_size = len(data)
-            total_size = FrameHeader.SIZE + frame_size
-
-            # Early check if reader has disconnected gracefully
-            if self._oieb.reader_pid == 0:
-                raise ReaderDeadException()
-
-            # Check if frame is too large
-            if total_size > self._oieb.payload_size:
-                raise FrameTooLargeException()
+    def write_frames(self, frames: Iterable[Union[bytes, bytearray, memoryview]]) -> int:
+        """
+        Write several frames in a single call
 
-            while True:
-                # Check if reader hasn't exited gracefully
-                if self._oieb.reader_pid == 0:
-                    raise ReaderDeadException()
+        Takes the writer lock once and flushes shared memory once for the batch,
+        signaling the reader once per frame. Frames written before waiting for
+        space are signaled first, so a batch larger than the buffer still drains.
 
-                logger.debug(
-                    "Write frame check: total_size=%d, payload_free_bytes=%d, payload_size=%d",
-                    total_size,
-                    self._oieb.payload_free_bytes,
-                    self._oieb.payload_size,
-                )
+        Args:
+            frames: Frame data to write, in order
 
-                # Calculate required space including potential wrap-around waste
-                space_to_end_check = self._oieb.payload_size - self._oieb.payload_write_pos
-                required_space = (
-                    total_size if space_to_end_check >= total_size
-                    else space_to_end_check + total_size  # wrap: waste at end + frame at beginning
-                )
+        Returns:
+            Number of frames written
 
-                if self._oieb.payload_free_bytes >= required_space:
-                    logger.debug("Have enough space, breaking from wait loop")
-                    break
+        Raises:
+            InvalidFrameSizeException: If a frame is empty
+            FrameTooLargeException: If a frame is too large for buffer
+            ReaderDeadException: If reader process died
+        """
+        count = 0
+        with self._lock:
+            self._check_writable()
+            try:
+                for data in frames:
+                    self._write_frame_locked(self._frame_bytes(data))
+                    count += 1
+            finally:
+                # Frames written before a failure are still delivered
+                self._signal_written_frames()
+
+        logger.debug("WriteFrames wrote %d frames", count)
+        return count
+
+    @staticmethod
+    def _frame_bytes(data: Union[bytes, bytearray, memoryview]) -> Union[bytes, bytearray, memoryview]:
+        """Validate frame data, viewing typed buffers as raw bytes"""
+        if isinstance(data, memoryview) and data.format != "B":
+            # Frame sizes are in bytes - view typed buffers (e.g. numpy arrays) as raw bytes
+            data = data.cast("B") if data.c_contiguous else memoryview(data.tobytes())
 
-                # Log detailed state before waiting
-                logger.info("About to wait on semaphore - not enough space")
-                logger.info("  total_size needed: %d", total_size)
-                logger.info("  payload_free_bytes: %d", self._oieb.payload_free_bytes)
-                logger.info("  payload_size: %d", self._oieb.payload_size)
-                logger.info("  payload_write_pos: %d", self._oieb.payload_write_pos)
-                logger.info("  payload_read_pos: %d", self._oieb.payload_read_pos)
-                logger.info("  metadata_written_bytes: %d", self._oieb.metadata_written_bytes)
-                logger.info("  reader_pid: %d", self._oieb.reader_pid)
-                logger.info("  writer_pid: %d", self._oieb.writer_pid)
-
-                # Log current OIEB state (direct from shared memory)
-                logger.debug("Current OIEB state: free_bytes=%d", self._oieb.payload_free_bytes)
-
-                # Wait for reader to free space (blocking)
-                logger.info("Waiting on sem_read semaphore...")
-                if not self._sem_read.acquire(timeout=self._write_timeout.total_seconds()):
-                    # Timeout - check if reader is alive
-                    if self._oieb.reader_pid == 0 or not platform.process_exists(self._oieb.reader_pid):
-                        raise ReaderDeadException()
-                    # Buffer is full - throw exception like C# does
-                    raise BufferFullException()
+        if len(data) == 0:
+            raise InvalidFrameSizeException()
+        return data
 
-                # Re-read OIEB after semaphore for next iteration
+    def _check_writable(self) -> None:
+        """Raise if the writer is closed; called with the lock held"""
+        if self._closed:
+            raise ZeroBufferException("Writer is closed")
 
-            # Check if we need to wrap
-            continuous_free = self._get_continuous_free_space()
-            space_to_end = self._oieb.payload_size - self._oieb.payload_write_pos
+    def _write_frame_locked(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Copy one frame into the buffer without signaling the reader
 
-            # We need to wrap if frame doesn't fit in continuous space
-            if continuous_free >= total_size and space_to_end < total_size:
-                # Need to wrap to beginning
-                # Write a special marker if there's space for at least a header
-                if space_to_end >= FrameHeader.SIZE:
-                    # Write wrap marker header
-                    wrap_header = FrameHeader(payload_size=0, sequence_number=0)
-                    payload_base = self._oieb_size + self._metadata_size
-                    wrap_offset = payload_base + self._oieb.payload_write_pos
-                    self._shm.write_bytes(wrap_offset, wrap_header.pack())
+        Must be called with the lock held, after _check_writable(). The frame
+        counts as unsignaled until _signal_written_frames() is called.
+        """
+        if not self._oieb:
+            raise ZeroBufferException("Writer not properly initialized")
 
-                # Account for the wasted space at the end - atomic to prevent lost updates
-                self._oieb.atomic_sub_payload_free_bytes(space_to_end)
+        frame_size = len(data)
+        total_size = FrameHeader.SIZE + frame_size
 
-                # Move to beginning of buffer
-                self._oieb.payload_write_pos = 0
-                self._oieb.payload_written_count += 1  # Count the wrap marker
+        # Early check if reader has disconnected gracefully
+        if self._oieb.reader_pid == 0:
+            raise ReaderDeadException()
 
-            # Write frame header
-            header = FrameHeader(payload_size=frame_size, sequence_number=self._sequence_number)
-            payload_base = self._oieb_size + self._metadata_size
-            header_offset = payload_base + self._oieb.payload_write_pos
-            self._shm.write_bytes(header_offset, header.pack())
+        # Check if frame is too large
+        if total_size > self._oieb.payload_size:
+            raise FrameTooLargeException()
 
-            # Write frame data
-            data_offset = header_offset + FrameHeader.SIZE
-            self._shm.write_bytes(data_offset, bytes(data))
+        while True:
+            # Check if reader hasn't exited gracefully
+            if self._oieb.reader_pid == 0:
+                raise ReaderDeadException()
 
-            # Update tracking
-            self._oieb.payload_write_pos += total_size
-            self._sequence_number += 1
-            self._frames_written += 1
-            self._bytes_written += frame_size
+            logger.debug(
+                "Write frame check: total_size=%d, payload_free_bytes=%d, payload_size=%d",
+                total_size,
+                self._oieb.payload_free_bytes,
+                self._oieb.payload_size,
+            )
+
+            # Calculate required space including potential wrap-around waste
+            space_to_end_check = self._oieb.payload_size - self._oieb.payload_write_pos
+            required_space = (
+                total_size if space_to_end_check >= total_size
+                else space_to_end_check + total_size  # wrap: waste at end + frame at beginning
+            )
+
+            if self._oieb.payload_free_bytes >= required_space:
+                logger.debug("Have enough space, breaking from wait loop")
+                break
+
+            # Log detailed state before waiting
+            logger.info("About to wait on semaphore - not enough space")
+            logger.info("  total_size needed: %d", total_size)
+            logger.info("  payload_free_bytes: %d", self._oieb.payload_free_bytes)
+            logger.info("  payload_size: %d", self._oieb.payload_size)
+            logger.info("  payload_write_pos: %d", self._oieb.payload_write_pos)
+            logger.info("  payload_read_pos: %d", self._oieb.payload_read_pos)
+            logger.info("  metadata_written_bytes: %d", self._oieb.metadata_written_bytes)
+            logger.info("  reader_pid: %d", self._oieb.reader_pid)
+            logger.info("  writer_pid: %d", self._oieb.writer_pid)
 
-            # Update OIEB - atomic to prevent lost updates when reader adds concurrently
-            self._oieb.atomic_sub_payload_free_bytes(total_size)
-            self._oieb.payload_written_count += 1
+            # Log current OIEB state (direct from shared memory)
+            logger.debug("Current OIEB state: free_bytes=%d", self._oieb.payload_free_bytes)
 
-            # Flush shared memory to ensure all writes are visible
-            self._shm.flush()
+            # Frames of the current batch must reach the reader before waiting for it to free space
+            self._signal_written_frames()
 
-            # Signal reader
+            # Wait for reader to free space (blocking)
+            logger.info("Waiting on sem_read semaphore...")
+            if not self._sem_read.acquire(timeout=self._write_timeout.total_seconds()):
+                # Timeout - check if reader is alive
+                if self._oieb.reader_pid == 0 or not platform.process_exists(self._oieb.reader_pid):
+                    raise ReaderDeadException()
+                # Buffer is full - throw exception like C# does
+                raise BufferFullException()
+
+            # Re-read OIEB after semaphore for next iteration
+
+        # Check if we need to wrap
+        continuous_free = self._get_continuous_free_space()
+        space_to_end = self._oieb.payload_size - self._oieb.payload_write_pos
+
+        # We need to wrap if frame doesn't fit in continuous space
+        if continuous_free >= total_size and space_to_end < total_size:
+            # Need to wrap to beginning
+            # Write a special marker if there's space for at least a header
+            if space_to_end >= FrameHeader.SIZE:
+                # Write wrap marker header
+                wrap_header = FrameHeader(payload_size=0, sequence_number=0)
+                payload_base = self._oieb_size + self._metadata_size
+                wrap_offset = payload_base + self._oieb.payload_write_pos
+                self._shm.write_bytes(wrap_offset, wrap_header.pack())
+
+            # Account for the wasted space at the end - atomic to prevent lost updates
+            self._oieb.atomic_sub_payload_free_bytes(space_to_end)
+
+            # Move to beginning of buffer
+            self._oieb.payload_write_pos = 0
+            self._oieb.payload_written_count += 1  # Count the wrap marker
+
+        # Write frame header
+        header = FrameHeader(payload_size=frame_size, sequence_number=self._sequence_number)
+        payload_base = self._oieb_size + self._metadata_size
+        header_offset = payload_base + self._oieb.payload_write_pos
+        self._shm.write_bytes(header_offset, header.pack())
+
+        # Write frame data
+        data_offset = header_offset + FrameHeader.SIZE
+        self._shm.write_bytes(data_offset, data)
+
+        # Update tracking
+        self._oieb.payload_write_pos += total_size
+        self._sequence_number += 1
+        self._frames_written += 1
+        self._bytes_written += frame_size
+
+        # Update OIEB - atomic to prevent lost updates when reader adds concurrently
+        self._oieb.atomic_sub_payload_free_bytes(total_size)
+        self._oieb.payload_written_count += 1
+        self._unsignaled_frames += 1
+
+    def _signal_written_frames(self) -> None:
+        """Make written frames visible and signal the reader once per frame; called with the lock held"""
+        if not self._unsignaled_frames:
+            return
+
+        # Flush shared memory to ensure all writes are visible
+        self._shm.flush()
+
+        # Signal reader
+        for _ in range(self._unsignaled_frames):
             self._sem_write.release()
+        self._unsignaled_frames = 0
 
     def get_frame_buffer(self, size: int) -> memoryview:
         """
@@ -12,6 +12,14 @@ from .step_registry import StepRegistry
 from .test_context import HarmonyTestContext
 from .logging.dual_logger import DualLoggerProvider
 
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    # uvloop is optional (and unavailable on Windows) - the default asyncio loop is used
+    UVLOOP_AVAILABLE = False
+
 
 async def main() -> None:
     """Main entry point for the serve application"""
@@ -73,4 +81,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    if UVLOOP_AVAILABLE:
+        # libuv-based loop - lower per-callback overhead for the JSON-RPC dispatch
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file
@@ -6,12 +6,15 @@ Similar to the C# DualLogger implementation.
 
 import logging
 import sys
-from typing import List, Dict, Any, Optional, Mapping
+from typing import List, Dict, Any, Optional, Mapping, Tuple
 from threading import Lock
 
 from dataclasses import dataclass
 
-@dataclass
+from ..models import _SLOTS
+
+
+@dataclass(**_SLOTS)
 class LogEntry:
     """Simple log entry for internal use"""
     level: str
@@ -32,10 +35,10 @@ class LogCollector:
             
     def get_and_clear(self) -> List[LogEntry]:
         """Get all logs and clear the collection"""
+        # Swap in a fresh list rather than copying and clearing under the lock
         with self._lock:
-            logs = self._logs.copy()
-            self._logs.clear()
-            return logs
+            logs, self._logs = self._logs, []
+        return logs
 
 
 class DualLogger(logging.Logger):
@@ -49,13 +52,37 @@ class DualLogger(logging.Logger):
              exc_info: Any = None, extra: Optional[Mapping[str, object]] = None, 
              stack_info: bool = False, stacklevel: int = 1) -> None:
         """Override to capture logs"""
+        # Don't format or collect records the logger would drop anyway
+        if not self.isEnabledFor(level):
+            return
+
         # Call parent to handle normal logging
         super()._log(level, msg, args, exc_info, extra, stack_info, stacklevel)
         
         # Also collect the log
-        level_name = logging.getLevelName(level)
         formatted_msg = str(msg) % args if args else str(msg)
-        self._collector.add(level_name, formatted_msg)
+        self._collector.add(logging.getLevelName(level), formatted_msg)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for all records within the same second (given a datefmt)"""
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None) -> None:
+        super().__init__(fmt, datefmt)
+        # (second, formatted time) - a single tuple so concurrent handlers never see a torn pair
+        self._cached_time: Tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record time, calling strftime only when the second changes"""
+        if datefmt is None:
+            # The default format carries the record's milliseconds, so it cannot be shared within a second
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second != cached_second:
+            cached_text = super().formatTime(record, datefmt)
+            self._cached_time = (second, cached_text)
+        return cached_text
 
 
 class DualLoggerProvider:
@@ -68,7 +95,7 @@ class DualLoggerProvider:
         # Configure stderr handler
         handler = logging.StreamHandler(sys.stderr)
         handler.setLevel(logging.DEBUG)
-        formatter = logging.Formatter(
+        formatter = CachedTimeFormatter(
             '[%(asctime)s.%(msecs)03d] [%(levelname)s] %(name)s: %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
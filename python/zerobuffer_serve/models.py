@@ -5,11 +5,15 @@ These models provide exact compatibility with the C# Harmony.Shared library for
 enterprise-grade cross-platform servo communication.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 
+# Models are created for every step and log line - drop the per-instance __dict__ where supported (Python 3.10+)
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class InitializeRequest:
     """Process initialization request - matches Harmony contract"""
     # Required fields from Harmony contract
@@ -25,7 +29,7 @@ class InitializeRequest:
         return f"{self.hostPid}_{self.featureId}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StepRequest:
     """Step execution request - matches Harmony.Shared.StepRequest exactly"""
     process: str = ""
@@ -37,7 +41,7 @@ class StepRequest:
 
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LogResponse:
     """Log response matching Harmony contract"""
     timestamp: str = ""  # ISO format timestamp
@@ -45,7 +49,7 @@ class LogResponse:
     message: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StepResponse:
     """Step execution response - matches Harmony.Shared.StepResponse exactly"""
     success: bool = True
@@ -54,14 +58,14 @@ class StepResponse:
     logs: Optional[List[LogResponse]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StepInfo:
     """Step definition information - matches Harmony.Shared.StepInfo"""
     type: str = ""  # "Given", "When", or "Then" (capitalized)
     pattern: str = ""  # Regex pattern for step matching
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DiscoverResponse:
     """Step discovery response - matches Harmony.Shared.DiscoverResponse"""
     steps: List[StepInfo] = field(default_factory=list)
\ No newline at end of file
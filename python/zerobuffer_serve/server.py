@@ -7,8 +7,12 @@ Uses python-lsp-jsonrpc for protocol handling over stdin/stdout.
 import asyncio
 import json
 import logging
+import os
+import stat
 import sys
-from typing import Dict, Any, Callable, Optional, BinaryIO, Union, List
+import threading
+from functools import lru_cache
+from typing import Dict, Any, Awaitable, Callable, Optional, BinaryIO, Union, List, Tuple
 from io import BufferedReader, BufferedWriter
 
 from .models import (
@@ -18,11 +22,108 @@ from .models import (
     DiscoverResponse,
     LogResponse
 )
+from dataclasses import asdict
 from datetime import datetime
 from .step_registry import StepRegistry
 from .test_context import HarmonyTestContext
 from .logging.dual_logger import DualLoggerProvider
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # orjson is optional - fall back to the standard json module
+    ORJSON_AVAILABLE = False
+
+
+# String log levels mapped to Microsoft.Extensions.Logging.LogLevel enum values
+_LOG_LEVELS: Dict[str, int] = {
+    "TRACE": 0,
+    "DEBUG": 1,
+    "INFO": 2,
+    "INFORMATION": 2,
+    "WARNING": 3,
+    "WARN": 3,
+    "ERROR": 4,
+    "CRITICAL": 5,
+    "FATAL": 5,
+    "NONE": 6
+}
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON-RPC message body"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a JSON-RPC message body to UTF-8 bytes"""
+    if ORJSON_AVAILABLE:
+        # Serializes dataclasses (e.g. LogResponse) natively
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=asdict).encode('utf-8')
+
+
+# Success response envelope {"jsonrpc":"2.0","id":<id>,"result":<result>} around the serialized parts
+_RESULT_PREFIX = b'{"jsonrpc":"2.0","id":'
+_RESULT_INFIX = b',"result":'
+
+# Bytes requested from stdin per read when the event loop watches the descriptor
+_READ_CHUNK = 64 * 1024
+
+# Most requests already queued by the stdin reader that are handled before responses are flushed
+_BATCH_LIMIT = 16
+
+# Responses up to this size are written to stdout together with their header in a single write
+_COALESCE_LIMIT = 64 * 1024
+
+
+@lru_cache(maxsize=64)
+def _camel_case(key: str) -> str:
+    """Convert a PascalCase field name (as sent by C# clients) to camelCase"""
+    return key[0].lower() + key[1:] if key else key
+
+
+def _normalize_keys(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of params with camelCase field names; names are only converted when some need it"""
+    if not any(key[:1].isupper() for key in params):
+        # Callers pop fields from the result, so the client's dict is still copied
+        return dict(params)
+    return {_camel_case(key): value for key, value in params.items()}
+
+
+# Field order of pure positional parameters
+_INITIALIZE_POSITIONAL = ('hostPid', 'featureId', 'role', 'platform', 'scenario', 'testRunId')
+_STEP_POSITIONAL = ('stepType', 'step', 'parameters', 'context')
+
+
+def _normalize_params(
+    params: Union[Dict[str, Any], List[Any]],
+    positional: Tuple[str, ...],
+    min_positional: int,
+    method: str
+) -> Dict[str, Any]:
+    """
+    Turn any of the parameter shapes clients send into a new dict with camelCase field names.
+    
+    Accepts named parameters, a single-element list wrapping them (Harmony), or at least
+    min_positional positional parameters in the field order given by positional.
+    
+    Raises:
+        ValueError: If params has none of these shapes
+    """
+    if isinstance(params, dict):
+        return _normalize_keys(params)
+    if isinstance(params, list):
+        if len(params) == 1 and isinstance(params[0], dict):
+            return _normalize_keys(params[0])
+        if len(params) >= min_positional:
+            return dict(zip(positional, params))
+    raise ValueError(f"Invalid {method} parameters: {params}")
+
 
 class ZeroBufferServe:
     """JSON-RPC server for ZeroBuffer test execution"""
@@ -39,13 +140,25 @@ class ZeroBufferServe:
         self._logger = logger_provider.get_logger(self.__class__.__name__)
         self._running = False
         
+        # Method dispatch table - built once, bound methods are stable for the server's lifetime
+        self._handlers: Dict[str, Callable[[Union[Dict[str, Any], List[Any]]], Awaitable[Any]]] = {
+            'health': self._handle_health,
+            'initialize': self._handle_initialize,
+            'discover': self._handle_discover,
+            'executeStep': self._handle_execute_step,
+            'cleanup': self._handle_cleanup,
+            'shutdown': self._handle_shutdown
+        }
+        
     async def run(self) -> None:
         """Run the JSON-RPC server on stdin/stdout"""
         self._logger.info("Starting JSON-RPC server on stdin/stdout")
         self._running = True
         
-        # Set up stdin/stdout for binary mode
-        stdin = sys.stdin.buffer
+        # Set up stdin/stdout for binary mode. Requests are read through a private reader on the stdin
+        # descriptor: its thread may still be blocked reading at interpreter shutdown, and must not be
+        # holding the lock of sys.stdin when the interpreter finalizes it
+        stdin = open(sys.stdin.fileno(), 'rb', closefd=False)
         stdout = sys.stdout.buffer
         
         # Create tasks for reading and writing
@@ -62,112 +175,256 @@ class ZeroBufferServe:
             self._logger.info("JSON-RPC server stopped")
     
     async def _read_loop(self, stdin: BinaryIO) -> None:
-        """Read and process JSON-RPC requests from stdin"""
-        loop = asyncio.get_event_loop()
+        """Process JSON-RPC requests read from stdin as the event loop or a reader thread receives them"""
+        loop = asyncio.get_running_loop()
+        messages: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
+        fd = stdin.fileno()
+        
+        evented = self._add_stdin_reader(loop, fd, messages)
+        if not evented:
+            # One thread owns the blocking stdin for the server's lifetime - no executor hop per line
+            reader_thread = threading.Thread(
+                target=self._read_messages, args=(stdin, loop, messages), name="jsonrpc-stdin", daemon=True
+            )
+            reader_thread.start()
         
+        try:
+            await self._process_messages(messages)
+        finally:
+            if evented:
+                loop.remove_reader(fd)
+                os.set_blocking(fd, True)
+                stdin.close()
+            # Otherwise the reader thread closes stdin when it stops - closing it here would wait for the
+            # thread's blocked read to return
+    
+    async def _process_messages(self, messages: "asyncio.Queue[Optional[bytes]]") -> None:
+        """Handle queued requests in arrival order until end of stream or shutdown"""
         while self._running:
-            try:
-                # Read headers first (LSP-style protocol)
-                headers = {}
-                while True:
-                    header_line = await loop.run_in_executor(None, stdin.readline)
-                    if not header_line:
-                        # End of stream
-                        return
-                    
-                    header_str = header_line.decode('utf-8').strip()
-                    if not header_str:
-                        # Empty line marks end of headers
-                        break
-                        
-                    # Parse header (e.g., "Content-Length: 123")
-                    if ':' in header_str:
-                        key, value = header_str.split(':', 1)
-                        headers[key.strip()] = value.strip()
-                
-                # Get content length from headers
-                if 'Content-Length' not in headers:
-                    self._logger.error("Missing Content-Length header")
-                    continue
-                    
-                content_length = int(headers['Content-Length'])
-                
-                # Read the JSON content
-                content_bytes = await loop.run_in_executor(None, stdin.read, content_length)
-                if not content_bytes:
+            batch = [await messages.get()]
+            # Drain whatever else a bursting client has already sent, so its responses go out in one flush
+            while len(batch) < _BATCH_LIMIT and not messages.empty():
+                batch.append(messages.get_nowait())
+            
+            responses: List[bytes] = []
+            for content_bytes in batch:
+                if content_bytes is None or not self._running:
+                    # End of stream, or shutdown requested earlier in the batch
                     break
-                    
-                request_text = content_bytes.decode('utf-8')
-                
-                # Parse and handle request
-                # self._logger.debug(f"Received request: {request_text}")  # Too verbose
-                
-                response = await self._handle_request(request_text)
                 
-                if response:
-                    await self._send_response(response)
+                try:
+                    # Parse and handle request - the JSON parser takes the UTF-8 bytes directly.
+                    # Requests run in arrival order: steps depend on the state left by earlier ones
+                    # self._logger.debug(f"Received request: {content_bytes!r}")  # Too verbose
                     
-            except Exception as e:
-                self._logger.error(f"Error in read loop: {e}", exc_info=True)
-                
-    async def _handle_request(self, request_text: str) -> Optional[str]:
-        """Handle a JSON-RPC request and return response"""
+                    response = await self._handle_request(content_bytes)
+                    
+                    if response:
+                        responses.append(response)
+                        
+                except Exception as e:
+                    self._logger.error(f"Error in read loop: {e}", exc_info=True)
+            
+            if responses:
+                try:
+                    await self._send_responses(responses)
+                except Exception as e:
+                    self._logger.error(f"Error in read loop: {e}", exc_info=True)
+            
+            if None in batch:
+                # End of stream
+                return
+    
+    def _add_stdin_reader(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        fd: int,
+        messages: "asyncio.Queue[Optional[bytes]]"
+    ) -> bool:
+        """
+        Have the event loop read stdin whenever it becomes readable.
+        
+        Only pipes and sockets are watched: stdin is switched to non-blocking mode for this, and that mode
+        belongs to the open file description, which a tty (or a socket used for both ends) shares with stdout.
+        
+        Returns:
+            False if the reader thread must be used instead (Windows, ttys, regular files, shared stdout)
+        """
+        if sys.platform == 'win32':
+            # Windows event loops cannot watch pipes - the reader thread is used instead
+            return False
+        
         try:
-            request = json.loads(request_text)
+            stdin_stat = os.fstat(fd)
+            stdout_stat = os.fstat(sys.stdout.fileno())
+        except (OSError, ValueError):
+            return False
+        if not (stat.S_ISFIFO(stdin_stat.st_mode) or stat.S_ISSOCK(stdin_stat.st_mode)):
+            return False
+        if (stdin_stat.st_dev, stdin_stat.st_ino) == (stdout_stat.st_dev, stdout_stat.st_ino):
+            # Same pipe or socket on both ends - non-blocking reads would make stdout writes non-blocking too
+            return False
+        
+        pending = bytearray()
+        
+        def on_readable() -> None:
+            try:
+                data = os.read(fd, _READ_CHUNK)
+            except BlockingIOError:
+                return
+            except OSError as e:
+                self._logger.error(f"Error in read loop: {e}", exc_info=True)
+                data = b''
             
-            # Extract request details
-            method = request.get('method', '')
-            params = request.get('params', {})
-            request_id = request.get('id')
+            if not data:
+                # End of stream
+                loop.remove_reader(fd)
+                messages.put_nowait(None)
+                return
+            
+            pending.extend(data)
+            self._parse_messages(pending, messages)
+        
+        try:
+            os.set_blocking(fd, False)
+            loop.add_reader(fd, on_readable)
+        except (OSError, NotImplementedError):
+            os.set_blocking(fd, True)
+            return False
+        return True
+    
+    def _parse_messages(self, pending: bytearray, messages: "asyncio.Queue[Optional[bytes]]") -> None:
+        """Queue every complete LSP-framed message at the start of pending and remove it from there"""
+        while True:
+            # Read headers first (LSP-style protocol) - Content-Length is the only one used
+            content_length = -1
+            start = 0
+            while True:
+                end_of_line = pending.find(b'\n', start)
+                if end_of_line < 0:
+                    # Headers not complete yet
+                    return
+                
+                header_line = pending[start:end_of_line].strip()
+                start = end_of_line + 1
+                if not header_line:
+                    # Empty line marks end of headers
+                    break
+                
+                # Parse header (e.g., "Content-Length: 123")
+                key, sep, value = header_line.partition(b':')
+                if sep and key.strip().lower() == b'content-length':
+                    try:
+                        content_length = int(value)
+                    except ValueError:
+                        self._logger.error("Invalid Content-Length header: %r", bytes(value))
             
-            # Normalize params - some clients send arrays, others send objects
-            if params is None:
-                params = {}
+            if content_length < 0:
+                self._logger.error("Missing Content-Length header")
+                del pending[:start]
+                continue
             
-            # Route to appropriate handler
-            result = await self._route_method(method, params)
+            end = start + content_length
+            if len(pending) < end:
+                # Content not complete yet
+                return
             
-            # Build response
-            if request_id is not None:
-                response = {
-                    'jsonrpc': '2.0',
-                    'id': request_id,
-                    'result': result
-                }
-                return json.dumps(response)
+            messages.put_nowait(bytes(pending[start:end]))
+            del pending[:end]
+    
+    def _read_messages(
+        self,
+        stdin: BinaryIO,
+        loop: asyncio.AbstractEventLoop,
+        messages: "asyncio.Queue[Optional[bytes]]"
+    ) -> None:
+        """Read LSP-framed messages from stdin (blocking) and hand them to the event loop"""
+        try:
+            while True:
+                try:
+                    # Read headers first (LSP-style protocol) - Content-Length is the only one used
+                    content_length = -1
+                    while True:
+                        header_line = stdin.readline()
+                        if not header_line:
+                            # End of stream
+                            return
+                        
+                        # Headers are ASCII - parse the raw bytes without decoding
+                        header_line = header_line.strip()
+                        if not header_line:
+                            # Empty line marks end of headers
+                            break
+                            
+                        # Parse header (e.g., "Content-Length: 123")
+                        key, sep, value = header_line.partition(b':')
+                        if sep and key.strip().lower() == b'content-length':
+                            content_length = int(value)
+                    
+                    if content_length < 0:
+                        self._logger.error("Missing Content-Length header")
+                        continue
+                    
+                    # Read the JSON content
+                    content_bytes = stdin.read(content_length)
+                    if not content_bytes:
+                        return
+                    
+                    loop.call_soon_threadsafe(messages.put_nowait, content_bytes)
+                    
+                except Exception as e:
+                    self._logger.error(f"Error in read loop: {e}", exc_info=True)
+        finally:
+            stdin.close()
+            try:
+                loop.call_soon_threadsafe(messages.put_nowait, None)
+            except RuntimeError:
+                # Event loop already closed - the server has stopped
+                pass
+                
+    async def _handle_request(self, content: bytes) -> Optional[bytes]:
+        """Handle a JSON-RPC request and return the serialized response"""
+        try:
+            request = _json_loads(content)
+            if not isinstance(request, dict):
+                raise ValueError(f"Expected a JSON-RPC request object, got {type(request).__name__}")
+        except ValueError as e:
+            # Unparseable message - there is no id to answer
+            self._logger.error(f"Error handling request: {e}", exc_info=True)
+            return None
+        
+        request_id = request.get('id')
+        
+        try:
+            # Route to appropriate handler (missing params are normalized to {} there)
+            result = await self._route_method(request.get('method', ''), request.get('params'))
             
             # No response for notifications (no id)
-            return None
+            if request_id is None:
+                return None
+            
+            # Splice the serialized id and result into a fixed envelope instead of building a dict for it
+            return _RESULT_PREFIX + _json_dumps(request_id) + _RESULT_INFIX + _json_dumps(result) + b'}'
             
         except Exception as e:
             self._logger.error(f"Error handling request: {e}", exc_info=True)
             
             # Return error response if we have an id
-            if 'request' in locals() and request.get('id') is not None:
-                error_response = {
-                    'jsonrpc': '2.0',
-                    'id': request.get('id'),
-                    'error': {
-                        'code': -32603,
-                        'message': str(e)
-                    }
+            if request_id is None:
+                return None
+            
+            return _json_dumps({
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'error': {
+                    'code': -32603,
+                    'message': str(e)
                 }
-                return json.dumps(error_response)
-                
-            return None
+            })
     
     async def _route_method(self, method: str, params: Union[Dict[str, Any], List[Any], None]) -> Any:
         """Route method to appropriate handler"""
-        handlers = {
-            'health': self._handle_health,
-            'initialize': self._handle_initialize,
-            'discover': self._handle_discover,
-            'executeStep': self._handle_execute_step,
-            'cleanup': self._handle_cleanup,
-            'shutdown': self._handle_shutdown
-        }
-        
-        handler = handlers.get(method)
+        handler = self._handlers.get(method)
         if not handler:
             raise ValueError(f"Unknown method: {method}")
             
@@ -177,21 +434,23 @@ class ZeroBufferServe:
             
         return await handler(params)
     
-    async def _send_response(self, response: str) -> None:
-        """Send JSON-RPC response to stdout with LSP-style headers"""
-        # Encode response to bytes to get accurate length
-        response_bytes = response.encode('utf-8')
-        content_length = len(response_bytes)
-        
-        # Send headers (Content-Length is required)
-        sys.stdout.buffer.write(f"Content-Length: {content_length}\r\n".encode('utf-8'))
-        sys.stdout.buffer.write(b"\r\n")  # Empty line to end headers
-        
-        # Send the JSON content
-        sys.stdout.buffer.write(response_bytes)
-        sys.stdout.buffer.flush()
+    async def _send_responses(self, responses: List[bytes]) -> None:
+        """Send serialized JSON-RPC responses to stdout with LSP-style headers, flushing once"""
+        stdout = sys.stdout.buffer
+        for response_bytes in responses:
+            # Headers (Content-Length is required) end with an empty line; the body is already UTF-8
+            header = b"Content-Length: %d\r\n\r\n" % len(response_bytes)
+            
+            if len(response_bytes) <= _COALESCE_LIMIT:
+                # One write per response - the concatenation is cheaper than a second locked write
+                stdout.write(header + response_bytes)
+            else:
+                # Large bodies (e.g. discover) are not worth copying just to prepend the header
+                stdout.write(header)
+                stdout.write(response_bytes)
+        stdout.flush()
         
-        # self._logger.debug(f"Sent response with Content-Length: {content_length}: {response}")  # Too verbose
+        # self._logger.debug(f"Sent response: {response_bytes!r}")  # Too verbose
     
     async def _handle_health(self, params: Union[Dict[str, Any], List[Any]]) -> bool:
         """Handle health check request - now parameterless per Harmony contract"""
@@ -202,53 +461,18 @@ class ZeroBufferServe:
     
     async def _handle_initialize(self, params: Union[Dict[str, Any], List[Any]]) -> bool:
         """Handle initialization request"""
-        # Handle various parameter formats from different clients
-        if isinstance(params, list):
-            if len(params) == 1 and isinstance(params[0], dict):
-                # Harmony format: [{'hostPid': 123, 'featureId': 1, ...}]
-                # Or C# format with PascalCase: [{'Role': 'reader', 'Platform': 'csharp', ...}]
-                param_dict = params[0]
-                # Normalize field names from PascalCase to camelCase
-                normalized_params = {}
-                for key, value in param_dict.items():
-                    # Convert PascalCase to camelCase
-                    normalized_key = key[0].lower() + key[1:] if key else key
-                    normalized_params[normalized_key] = value
-                # Remove testRunId as it's a computed property in Python
-                if 'testRunId' in normalized_params:
-                    normalized_params.pop('testRunId')
-                request = InitializeRequest(**normalized_params)
-            elif len(params) >= 6:
-                # Pure positional parameters [hostPid, featureId, role, platform, scenario, testRunId]
-                request = InitializeRequest(
-                    hostPid=params[0],
-                    featureId=params[1], 
-                    role=params[2],
-                    platform=params[3],
-                    scenario=params[4]
-                )
-            else:
-                raise ValueError(f"Invalid initialize parameters: {params}")
-        elif isinstance(params, dict):
-            # Direct named parameters - normalize field names to lowercase
-            # C# sends uppercase (Role, Platform) while Python expects lowercase
-            normalized_params = {}
-            for key, value in params.items():
-                # Convert PascalCase to lowercase
-                normalized_key = key[0].lower() + key[1:] if key else key
-                normalized_params[normalized_key] = value
-            
-            # Remove testRunId as it's a computed property in Python
-            if 'testRunId' in normalized_params:
-                normalized_params.pop('testRunId')
-                
-            request = InitializeRequest(**normalized_params)
-        else:
-            raise ValueError(f"Invalid initialize parameters: {params}")
+        # Harmony format: [{'hostPid': 123, 'featureId': 1, ...}]
+        # Or C# format with PascalCase: [{'Role': 'reader', 'Platform': 'csharp', ...}]
+        # Or pure positional parameters [hostPid, featureId, role, platform, scenario, testRunId]
+        normalized_params = _normalize_params(params, _INITIALIZE_POSITIONAL, 6, "initialize")
+        
+        # Remove testRunId as it's a computed property in Python
+        normalized_params.pop('testRunId', None)
+        request = InitializeRequest(**normalized_params)
             
         self._logger.info(
-            f"Initializing with hostPid: {request.hostPid}, featureId: {request.featureId}, "
-            f"role: {request.role}, platform: {request.platform}, scenario: {request.scenario}"
+            "Initializing with hostPid: %s, featureId: %s, role: %s, platform: %s, scenario: %s",
+            request.hostPid, request.featureId, request.role, request.platform, request.scenario
         )
         
         try:
@@ -278,76 +502,37 @@ class ZeroBufferServe:
         steps = self._step_registry.get_all_steps()
         response = DiscoverResponse(steps=steps)
         
-        self._logger.info(f"Discovered {len(response.steps)} step definitions")
+        self._logger.info("Discovered %d step definitions", len(response.steps))
         
-        # Convert to dict for JSON serialization
-        return {
-            'steps': [
-                {'type': step.type, 'pattern': step.pattern}
-                for step in response.steps
-            ]
-        }
+        # StepInfo dataclasses serialize as {type, pattern} objects - no per-step dict needed
+        return {'steps': response.steps}
     
     async def _handle_execute_step(self, params: Union[Dict[str, Any], List[Any]]) -> Dict[str, Any]:
         """Handle step execution request"""
-        # Handle various parameter formats from different clients
-        if isinstance(params, list):
-            if len(params) == 1 and isinstance(params[0], dict):
-                # Harmony format: [{'stepType': 'Given', 'step': '...', ...}]
-                # Or C# format with PascalCase: [{'StepType': 'Given', 'Step': '...', ...}]
-                param_dict = params[0]
-                # Normalize field names from PascalCase to camelCase
-                normalized_params = {}
-                for key, value in param_dict.items():
-                    # Convert PascalCase to camelCase
-                    if key and key[0].isupper():
-                        normalized_key = key[0].lower() + key[1:] if len(key) > 1 else key.lower()
-                    else:
-                        normalized_key = key
-                    normalized_params[normalized_key] = value
-                # Handle stepType as integer enum from C#
-                if 'stepType' in normalized_params and isinstance(normalized_params['stepType'], int):
-                    step_types = ['Given', 'When', 'Then']
-                    normalized_params['stepType'] = step_types[normalized_params['stepType']] if normalized_params['stepType'] < len(step_types) else 'Given'
-                request = StepRequest(**normalized_params)
-            elif len(params) >= 3:
-                # Pure positional parameters [stepType, step, parameters, context]
-                request = StepRequest(
-                    stepType=params[0],
-                    step=params[1],
-                    parameters=params[2] if len(params) > 2 else {},
-                    context=params[3] if len(params) > 3 else {}
-                )
-            else:
-                raise ValueError(f"Invalid executeStep parameters: {params}")
-        elif isinstance(params, dict):
-            # Direct named parameters - handle different parameter names
-            # Normalize field names from PascalCase to camelCase
-            normalized_params = {}
-            for key, value in params.items():
-                # Convert PascalCase to camelCase
-                if key and key[0].isupper():
-                    normalized_key = key[0].lower() + key[1:] if len(key) > 1 else key.lower()
-                else:
-                    normalized_key = key
-                normalized_params[normalized_key] = value
-            
-            # Map common variations to expected names
-            if 'type' in normalized_params and 'stepType' not in normalized_params:
-                normalized_params['stepType'] = normalized_params.pop('type')
-            if 'text' in normalized_params and 'step' not in normalized_params:
-                normalized_params['step'] = normalized_params.pop('text')
-            request = StepRequest(**normalized_params)
-        else:
-            raise ValueError(f"Invalid executeStep parameters: {params}")
+        # Harmony format: [{'stepType': 'Given', 'step': '...', ...}]
+        # Or C# format with PascalCase: [{'StepType': 'Given', 'Step': '...', ...}]
+        # Or pure positional parameters [stepType, step, parameters, context]
+        normalized_params = _normalize_params(params, _STEP_POSITIONAL, 3, "executeStep")
+        
+        # Read field aliases with lookups rather than rewriting the dict with pop-and-assign
+        step_type = normalized_params.get('stepType', normalized_params.get('type', ''))
+        
+        # Handle stepType as integer enum from C#
+        if isinstance(step_type, int):
+            step_types = ['Given', 'When', 'Then']
+            step_type = step_types[step_type] if step_type < len(step_types) else 'Given'
         
-        # Ensure parameters and context are dicts (not None)
-        if request.parameters is None:
-            request.parameters = {}
-        if request.context is None:
-            request.context = {}
+        request = StepRequest(
+            process=normalized_params.get('process', ''),
+            stepType=step_type,
+            step=normalized_params.get('step', normalized_params.get('text', '')),
+            # Ensure parameters and context are dicts (not None)
+            parameters=normalized_params.get('parameters') or {},
+            context=normalized_params.get('context') or {},
+            isBroadcast=normalized_params.get('isBroadcast', False)
+        )
             
-        self._logger.info(f"Executing step: {request.stepType} {request.step}")
+        self._logger.info("Executing step: %s %s", request.stepType, request.step)
         
         try:
             # Execute the step with context
@@ -360,51 +545,28 @@ class ZeroBufferServe:
             
             self._logger.info("Step executed successfully")
             
-            # Collect logs and convert to LogResponse format
+            # Convert collected logs to LogResponse format, appending straight onto the result's logs
+            # in a single pass - get_all_logs already hands over the collector's list without copying
             collected_logs = self._logger_provider.get_all_logs()
-            
-            # Map string log levels to Microsoft.Extensions.Logging.LogLevel enum values
-            level_map = {
-                "TRACE": 0,
-                "DEBUG": 1, 
-                "INFO": 2,
-                "INFORMATION": 2,
-                "WARNING": 3,
-                "WARN": 3,
-                "ERROR": 4,
-                "CRITICAL": 5,
-                "FATAL": 5,
-                "NONE": 6
-            }
-            
-            log_responses = [
+            timestamp = datetime.utcnow().isoformat() + 'Z'
+            if result.logs is None:
+                result.logs = []
+            result.logs.extend(
                 LogResponse(
-                    timestamp=datetime.utcnow().isoformat() + 'Z',
-                    level=level_map.get(log.level.upper(), 2),  # Default to Information (2)
+                    timestamp=timestamp,
+                    level=_LOG_LEVELS.get(log.level.upper(), 2),  # Default to Information (2)
                     message=log.message
                 )
                 for log in collected_logs
-            ]
-            
-            # Add collected logs to result
-            if result.logs is None:
-                result.logs = log_responses
-            else:
-                result.logs.extend(log_responses)
+            )
             
-            # Convert to dict for JSON serialization matching Harmony contract
+            # Dict matching the Harmony contract - LogResponse dataclasses serialize as
+            # {timestamp, level, message} objects, so logs need no per-entry dict
             return {
                 'success': result.success,
                 'error': result.error,
                 'context': result.context or {},  # Use context instead of data
-                'logs': [
-                    {
-                        'timestamp': log.timestamp,
-                        'level': log.level,  # Already numeric from LogResponse
-                        'message': log.message
-                    }
-                    for log in (result.logs or [])
-                ]
+                'logs': result.logs
             }
             
         except Exception as e:
@@ -414,23 +576,11 @@ class ZeroBufferServe:
             logs = self._logger_provider.get_all_logs()
             
             # Convert logs to LogResponse format with numeric log levels
-            level_map = {
-                "TRACE": 0,
-                "DEBUG": 1, 
-                "INFO": 2,
-                "INFORMATION": 2,
-                "WARNING": 3,
-                "WARN": 3,
-                "ERROR": 4,
-                "CRITICAL": 5,
-                "FATAL": 5,
-                "NONE": 6
-            }
-            
+            timestamp = datetime.utcnow().isoformat() + 'Z'
             error_log_responses: List[Dict[str, Any]] = [
                 {
-                    'timestamp': datetime.utcnow().isoformat() + 'Z',
-                    'level': level_map.get(log.level.upper(), 2),  # Default to Information (2)
+                    'timestamp': timestamp,
+                    'level': _LOG_LEVELS.get(log.level.upper(), 2),  # Default to Information (2)
                     'message': log.message
                 }
                 for log in logs
@@ -5,15 +5,17 @@ Import all step definition classes to make them available for discovery.
 """
 
 from .basic_communication import BasicCommunicationSteps
-from .benchmarks import BenchmarksSteps
 from .duplex_channel import DuplexChannelSteps
-from .edge_cases import EdgeCasesSteps
-from .error_handling import ErrorHandlingSteps
-from .initialization import InitializationSteps
-from .performance import PerformanceSteps
-from .process_lifecycle import ProcessLifecycleSteps
-from .stress_tests import StressTestsSteps
-from .synchronization import SynchronizationSteps
+from ._stubs import (
+    BenchmarksSteps,
+    EdgeCasesSteps,
+    ErrorHandlingSteps,
+    InitializationSteps,
+    PerformanceSteps,
+    ProcessLifecycleSteps,
+    StressTestsSteps,
+    SynchronizationSteps,
+)
 
 __all__ = [
     'BasicCommunicationSteps',
@@ -0,0 +1,82 @@
+"""
+Placeholder step definitions
+
+Step classes for feature areas that have no Python steps yet. They live in one
+module so the serve process does not import a separate file for each of them.
+"""
+
+from typing import Any
+import logging
+from .base import BaseSteps
+
+
+class BenchmarksSteps(BaseSteps):
+    """Step definitions for benchmark tests"""
+    
+    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
+        super().__init__(test_context, logger)
+        
+    # TODO: Implement benchmark steps
+
+
+class EdgeCasesSteps(BaseSteps):
+    """Step definitions for edge case tests"""
+    
+    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
+        super().__init__(test_context, logger)
+        
+    # TODO: Implement edge case steps
+
+
+class ErrorHandlingSteps(BaseSteps):
+    """Step definitions for error handling tests"""
+    
+    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
+        super().__init__(test_context, logger)
+        
+    # TODO: Implement error handling steps
+
+
+class InitializationSteps(BaseSteps):
+    """Step definitions for initialization tests"""
+    
+    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
+        super().__init__(test_context, logger)
+        
+    # TODO: Implement initialization steps
+
+
+class PerformanceSteps(BaseSteps):
+    """Step definitions for performance tests"""
+    
+    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
+        super().__init__(test_context, logger)
+        
+    # TODO: Implement performance steps
+
+
+class ProcessLifecycleSteps(BaseSteps):
+    """Step definitions for process lifecycle tests"""
+    
+    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
+        super().__init__(test_context, logger)
+        
+    # TODO: Implement process lifecycle steps
+
+
+class StressTestsSteps(BaseSteps):
+    """Step definitions for stress tests"""
+    
+    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
+        super().__init__(test_context, logger)
+        
+    # TODO: Implement stress test steps
+
+
+class SynchronizationSteps(BaseSteps):
+    """Step definitions for synchronization tests"""
+    
+    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
+        super().__init__(test_context, logger)
+        
+    # TODO: Implement synchronization steps
@@ -1,19 +0,0 @@
-"""
-Benchmark step definitions
-
-Implements test steps for performance benchmarking.
-"""
-
-from typing import Any
-import logging
-from .base import BaseSteps
-from ..step_registry import given, when, then
-
-
-class BenchmarksSteps(BaseSteps):
-    """Step definitions for benchmark tests"""
-    
-    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
-        super().__init__(test_context, logger)
-        
-    # TODO: Implement benchmark steps
\ No newline at end of file
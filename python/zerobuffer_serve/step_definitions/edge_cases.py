@@ -1,19 +0,0 @@
-"""
-Edge case step definitions
-
-Implements test steps for edge cases and boundary conditions.
-"""
-
-from typing import Any
-import logging
-from .base import BaseSteps
-from ..step_registry import given, when, then
-
-
-class EdgeCasesSteps(BaseSteps):
-    """Step definitions for edge case tests"""
-    
-    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
-        super().__init__(test_context, logger)
-        
-    # TODO: Implement edge case steps
\ No newline at end of file
@@ -1,19 +0,0 @@
-"""
-Error handling step definitions
-
-Implements test steps for error conditions and recovery.
-"""
-
-from typing import Any
-import logging
-from .base import BaseSteps
-from ..step_registry import given, when, then
-
-
-class ErrorHandlingSteps(BaseSteps):
-    """Step definitions for error handling tests"""
-    
-    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
-        super().__init__(test_context, logger)
-        
-    # TODO: Implement error handling steps
\ No newline at end of file
@@ -1,19 +0,0 @@
-"""
-Initialization step definitions
-
-Implements test steps for initialization and setup scenarios.
-"""
-
-from typing import Any
-import logging
-from .base import BaseSteps
-from ..step_registry import given, when, then
-
-
-class InitializationSteps(BaseSteps):
-    """Step definitions for initialization tests"""
-    
-    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
-        super().__init__(test_context, logger)
-        
-    # TODO: Implement initialization steps
\ No newline at end of file
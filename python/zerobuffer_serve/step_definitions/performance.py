@@ -1,19 +0,0 @@
-"""
-Performance step definitions
-
-Implements test steps for performance testing.
-"""
-
-from typing import Any
-import logging
-from .base import BaseSteps
-from ..step_registry import given, when, then
-
-
-class PerformanceSteps(BaseSteps):
-    """Step definitions for performance tests"""
-    
-    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
-        super().__init__(test_context, logger)
-        
-    # TODO: Implement performance steps
\ No newline at end of file
@@ -1,19 +0,0 @@
-"""
-Process lifecycle step definitions
-
-Implements test steps for process lifecycle management.
-"""
-
-from typing import Any
-import logging
-from .base import BaseSteps
-from ..step_registry import given, when, then
-
-
-class ProcessLifecycleSteps(BaseSteps):
-    """Step definitions for process lifecycle tests"""
-    
-    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
-        super().__init__(test_context, logger)
-        
-    # TODO: Implement process lifecycle steps
\ No newline at end of file
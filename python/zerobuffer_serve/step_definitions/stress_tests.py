@@ -1,19 +0,0 @@
-"""
-Stress test step definitions
-
-Implements test steps for stress testing and load scenarios.
-"""
-
-from typing import Any
-import logging
-from .base import BaseSteps
-from ..step_registry import given, when, then
-
-
-class StressTestsSteps(BaseSteps):
-    """Step definitions for stress tests"""
-    
-    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
-        super().__init__(test_context, logger)
-        
-    # TODO: Implement stress test steps
\ No newline at end of file
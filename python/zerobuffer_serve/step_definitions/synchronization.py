@@ -1,19 +0,0 @@
-"""
-Synchronization step definitions
-
-Implements test steps for synchronization and timing scenarios.
-"""
-
-from typing import Any
-import logging
-from .base import BaseSteps
-from ..step_registry import given, when, then
-
-
-class SynchronizationSteps(BaseSteps):
-    """Step definitions for synchronization tests"""
-    
-    def __init__(self, test_context: Any, logger: logging.Logger) -> None:
-        super().__init__(test_context, logger)
-        
-    # TODO: Implement synchronization steps
\ No newline at end of file
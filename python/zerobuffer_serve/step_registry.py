@@ -38,6 +38,17 @@ class StepType(Enum):
     THEN = "then"
 
 
+# Step keywords in the spellings clients send ("Given", "given", "GIVEN"), resolved with one dict lookup
+_STEP_TYPES: Dict[str, StepType] = {
+    spelling: step_type
+    for step_type in StepType
+    for spelling in (step_type.value, step_type.value.capitalize(), step_type.value.upper())
+}
+
+# Most step texts whose matching definition is remembered before the cache starts over
+_MATCH_CACHE_SIZE = 1024
+
+
 class StepDefinitionInfo:
     """Information about a registered step"""
     
@@ -67,6 +78,8 @@ class StepRegistry:
             StepType.THEN: []
         }
         self._instances: List[Any] = []
+        # Step text -> first matching definition, so repeated steps skip the scan over all patterns
+        self._match_cache: Dict[Tuple[StepType, str], StepDefinitionInfo] = {}
         
     def register_instance(self, instance: Any) -> None:
         """Register an instance containing step definitions"""
@@ -174,6 +187,8 @@ class StepRegistry:
         )
         
         self._steps[step_type].append(step_info)
+        # A new definition may match texts that were resolved before it existed
+        self._match_cache.clear()
         
         self._logger.debug(
             f"Registered {step_type.value} step: {pattern} -> "
@@ -202,19 +217,15 @@ class StepRegistry:
     ) -> StepResponse:
         """Execute a step by matching it to a definition"""
         try:
-            self._logger.debug(f"Executing step: {step_type} {step_text}")
+            self._logger.debug("Executing step: %s %s", step_type, step_text)
             
             # Parse step type
-            if step_type.lower() == "and":
-                # For "and" steps, try all types
-                matching_step, match = self._find_matching_step_any_type(step_text)
+            typed_step_type = _STEP_TYPES.get(step_type) or _STEP_TYPES.get(step_type.lower())
+            if typed_step_type is not None:
+                matching_step, match = self._find_matching_step(typed_step_type, step_text)
             else:
-                try:
-                    typed_step_type = StepType(step_type.lower())
-                    matching_step, match = self._find_matching_step(typed_step_type, step_text)
-                except ValueError:
-                    # Invalid step type, try all
-                    matching_step, match = self._find_matching_step_any_type(step_text)
+                # "And" steps (or an invalid step type) - try all types
+                matching_step, match = self._find_matching_step_any_type(step_text)
                     
             if not matching_step or not match:
                 error = f"No matching step definition found for: {step_type} {step_text}"
@@ -248,9 +259,17 @@ class StepRegistry:
         step_text: str
     ) -> Tuple[Optional[StepDefinitionInfo], Optional[Match]]:
         """Find a matching step definition of a specific type"""
+        key = (step_type, step_text)
+        cached = self._match_cache.get(key)
+        if cached is not None:
+            return cached, cached.regex.match(step_text)
+        
         for step in self._steps[step_type]:
             match = step.regex.match(step_text)
             if match:
+                if len(self._match_cache) >= _MATCH_CACHE_SIZE:
+                    self._match_cache.clear()
+                self._match_cache[key] = step
                 return step, match
         return None, None
         
@@ -262,7 +281,7 @@ class StepRegistry:
         for step_type in StepType:
             step, match = self._find_matching_step(step_type, step_text)
             if step:
-                self._logger.debug(f"Found matching {step_type.value} step for 'and' step")
+                self._logger.debug("Found matching %s step for 'and' step", step_type.value)
                 return step, match
         return None, None
         
@@ -285,7 +304,7 @@ class StepRegistry:
                 result = step_info.method(*method_params)
                 
             # Log success
-            self._logger.info(f"Step executed: {step_info.method.__name__}")
+            self._logger.info("Step executed: %s", step_info.method.__name__)
             
             # Return success with updated context
             return StepResponse(
@@ -5,6 +5,22 @@ This module provides the same test data generation patterns as the C# implementa
 to ensure consistent data across Python and C# test processes.
 """
 
+from typing import Union
+
+# Only the largest block built so far is kept - every shorter pattern is a slice of it, so memory
+# stays bounded by one frame however many sizes a test uses
+_sequential_cache = b""
+
+
+def _sequential_block(size: int) -> bytes:
+    """Bytes 0..255 repeated, long enough to slice size bytes at any starting offset"""
+    global _sequential_cache
+    block = _sequential_cache
+    if len(block) < size + 256:
+        block = bytes(range(256)) * (size // 256 + 2)
+        _sequential_cache = block
+    return block
+
 
 class TestDataPatterns:
     """Shared test data patterns for consistent data generation across processes"""
@@ -21,16 +37,32 @@ class TestDataPatterns:
         Returns:
             Generated frame data as bytes
         """
-        data = bytearray(size)
-        for i in range(size):
-            data[i] = (i + sequence) % 256
-        return bytes(data)
+        # One slice of the cached 0..255 block instead of a per-byte loop
+        start = sequence % 256
+        return _sequential_block(size)[start:start + size]
+    
+    @staticmethod
+    def verify_frame_data(data: Union[bytes, memoryview], sequence: int) -> bool:
+        """
+        Verify that frame data matches generate_frame_data(len(data), sequence)
+        
+        Compares against a slice of a cached block, without building the expected bytes.
+        
+        Args:
+            data: Frame data to verify (a frame memoryview is compared without copying)
+            sequence: Sequence number the data was generated for
+            
+        Returns:
+            True if data matches the pattern, False otherwise
+        """
+        start = sequence % 256
+        return memoryview(_sequential_block(len(data)))[start:start + len(data)] == data
     
     @staticmethod
     def generate_simple_frame_data(size: int) -> bytes:
         """
         Generate simple test data for a frame based only on size
-        Used when sequence number is not known at write time
+        Used when sequence number is not known at write time.
         
         Args:
             size: Size of the frame data in bytes
@@ -38,26 +70,20 @@ class TestDataPatterns:
         Returns:
             Generated frame data as bytes
         """
-        data = bytearray(size)
-        for i in range(size):
-            data[i] = i % 256
-        return bytes(data)
+        return _sequential_block(size)[:size]
     
     @staticmethod
-    def verify_simple_frame_data(data: bytes) -> bool:
+    def verify_simple_frame_data(data: Union[bytes, memoryview]) -> bool:
         """
         Verify that frame data matches the simple pattern
         
         Args:
-            data: Frame data to verify
+            data: Frame data to verify (a frame memoryview is compared without copying)
             
         Returns:
             True if data matches the simple pattern, False otherwise
         """
-        for i in range(len(data)):
-            if data[i] != i % 256:
-                return False
-        return True
+        return memoryview(_sequential_block(len(data)))[:len(data)] == data
     
     @staticmethod
     def generate_metadata(size: int) -> bytes:
@@ -70,7 +96,4 @@ class TestDataPatterns:
         Returns:
             Generated metadata as bytes
         """
-        metadata = bytearray(size)
-        for i in range(size):
-            metadata[i] = i % 256
-        return bytes(metadata)
\ No newline at end of file
+        return _sequential_block(size)[:size]
\ No newline at end of file